@@ -899,6 +899,19 @@ def _show_entries_table(
     projects = set(project_filter)
     components = _normalize_component_filters(component_filter, config)
 
+    # Handle scope-based filtering (no specific identifiers provided). The
+    # scope path loads entries itself, so skip the identifier lookup tables.
+    if not identifiers:
+        _show_entries_table_all(
+            ctx,
+            release_mode=release_mode,
+            scope=scope,
+            components=components,
+            include_emoji=include_emoji,
+            banner=banner,
+        )
+        return
+
     entries = list(iter_entries(project_root))
     entry_map: dict[str, list[Entry]] = {}
     for entry in entries:
@@ -913,18 +926,6 @@ def _show_entries_table(
     all_entries = [entry for occurrences in entry_map.values() for entry in occurrences]
     sorted_entries = _sort_entries_for_display(all_entries, release_index, release_order)
 
-    # Handle scope-based filtering (no specific identifiers provided)
-    if not identifiers:
-        _show_entries_table_all(
-            ctx,
-            release_mode=release_mode,
-            scope=scope,
-            components=components,
-            include_emoji=include_emoji,
-            banner=banner,
-        )
-        return
-
     if release_mode:
         _show_entries_table_release_mode(
             ctx,
@@ -8,7 +8,7 @@ from typing import Any, Literal, MutableMapping, cast
 
 import yaml
 
-from .utils import parse_components
+from .utils import load_yaml, parse_components
 
 ExportStyle = Literal["standard", "compact"]
 ReleaseVersionBumpMode = Literal["auto", "off"]
@@ -66,7 +66,7 @@ class Config:
 def load_config(path: Path) -> Config:
     """Load the configuration from disk."""
     with path.open("r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+        raw = load_yaml(handle) or {}
     if not isinstance(raw, MutableMapping):
         raise ValueError("Config root must be a mapping")
 
@@ -189,7 +189,7 @@ def load_package_config(path: Path) -> Config:
     """Load changelog configuration metadata from a package manifest."""
 
     with path.open("r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+        raw = load_yaml(handle) or {}
     if not isinstance(raw, MutableMapping):
         raise ValueError("Package metadata must be a mapping")
 
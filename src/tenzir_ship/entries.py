@@ -4,13 +4,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+import functools
+import os
+import re
+import sys
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Optional, cast
 
 import yaml
 from click import ClickException
 
-from .utils import coerce_datetime, slugify
+from .utils import coerce_datetime, load_yaml, slugify
 
 UNRELEASED_DIR = Path("unreleased")
 ENTRY_DIRECTORY_ANCHOR = ".gitkeep"
@@ -22,11 +26,16 @@ ENTRY_DIRECTORY_ANCHOR_TEXT = (
     "# rename and moving entries from long-lived branches into a release.\n"
 )
 ENTRY_TYPES = ("breaking", "feature", "bugfix", "change")
+_MIN_CREATED = datetime.min.replace(tzinfo=timezone.utc)
 
 
 @dataclass
 class Entry:
-    """Representation of a changelog entry file."""
+    """Representation of a changelog entry file.
+
+    Derived metadata views are cached on first access; the metadata dict is
+    treated as read-only once an entry has been loaded.
+    """
 
     entry_id: str
     metadata: dict[str, Any]
@@ -42,15 +51,16 @@ class Entry:
     def type(self) -> str:
         return str(self.metadata.get("type", "change"))
 
-    @property
+    @functools.cached_property
     def components(self) -> list[str]:
         """Return the list of components for the entry."""
         value = self.metadata.get("components")
         if value is None:
             return []
         if isinstance(value, list):
-            return [str(item).strip() for item in value if str(item).strip()]
-        return [str(value).strip()] if str(value).strip() else []
+            return [text for item in value if (text := _strip_text(item))]
+        text = _strip_text(value)
+        return [text] if text else []
 
     @property
     def component(self) -> Optional[str]:
@@ -58,7 +68,7 @@ class Entry:
         components = self.components
         return components[0] if components else None
 
-    @property
+    @functools.cached_property
     def project(self) -> Optional[str]:
         """Return the single project an entry belongs to."""
         try:
@@ -68,27 +78,47 @@ class Entry:
                 f"Entry '{self.entry_id}' has invalid project metadata: {exc}"
             ) from exc
 
-    @property
+    @functools.cached_property
     def projects(self) -> list[str]:
         project = self.project
         return [project] if project else []
 
-    @property
+    @functools.cached_property
     def created_at(self) -> Optional[datetime]:
         return coerce_datetime(self.metadata.get("created"))
 
-    @property
+    @functools.cached_property
     def created_date(self) -> Optional[date]:
         """Return just the date portion of created_at for display."""
         dt = self.created_at
         return dt.date() if dt else None
 
 
+def _strip_text(value: object) -> str:
+    """Return the stripped string form of a metadata value."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
 def entry_directory(project_root: Path) -> Path:
     """Return the directory containing unreleased changelog entries."""
     return project_root / UNRELEASED_DIR
 
 
+def list_entry_files(directory: Path) -> list[Path]:
+    """Return the Markdown files in an entry directory, sorted by name.
+
+    A missing directory yields an empty list.
+    """
+    try:
+        with os.scandir(directory) as it:
+            names = sorted(item.name for item in it if item.name.endswith(".md"))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [directory / name for name in names]
+
+
 def ensure_entry_directory(project_root: Path) -> Path:
     """Create the unreleased entry directory and its tracked anchor file."""
     directory = entry_directory(project_root)
@@ -99,19 +129,126 @@ def ensure_entry_directory(project_root: Path) -> Path:
     return directory
 
 
+def _split_frontmatter(data: bytes) -> tuple[str, str]:
+    """Split raw entry bytes into decoded frontmatter and body text.
+
+    Delimiters are located on the undecoded bytes so that only the two slices
+    get decoded. Line endings are normalized like text-mode reads.
+    """
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    start = data.find(b"---\n")
+    if start < 0:
+        return "", ""
+    start += 4
+    end = data.find(b"\n---\n", start)
+    if end < 0:
+        return data[start:].decode("utf-8"), ""
+    return data[start:end].decode("utf-8"), data[end + 5 :].decode("utf-8")
+
+
+# Frontmatter written by format_frontmatter uses a small subset of YAML: one
+# `key: value` pair per line, or a bare `key:` followed by `- item` lines.
+# _parse_frontmatter reads that subset directly and hands everything else to
+# the YAML loader. It only accepts scalars whose YAML type is unambiguous.
+_FRONTMATTER_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_PLAIN_STRING = re.compile(r"[A-Za-z][A-Za-z0-9 .,_/()'-]*")
+_PLAIN_INT = re.compile(r"0|[1-9][0-9]*")
+_PLAIN_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_PLAIN_UTC_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z"
+)
+# Words YAML 1.1 resolves to booleans or null rather than strings.
+_YAML_RESERVED_WORDS = frozenset(
+    "yes Yes YES no No NO true True TRUE false False FALSE "
+    "on On ON off Off OFF null Null NULL".split()
+)
+
+
+class _UnsupportedFrontmatter(Exception):
+    """Raised when frontmatter falls outside the subset parsed directly."""
+
+
+def _parse_plain_scalar(text: str) -> Any:
+    if text != text.strip():
+        raise _UnsupportedFrontmatter
+    if _PLAIN_STRING.fullmatch(text):
+        if text in _YAML_RESERVED_WORDS:
+            raise _UnsupportedFrontmatter
+        return text
+    if _PLAIN_INT.fullmatch(text):
+        return int(text)
+    try:
+        if match := _PLAIN_UTC_DATETIME.fullmatch(text):
+            year, month, day, hour, minute, second, fraction = match.groups()
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                int((fraction or "").ljust(6, "0")),
+                tzinfo=timezone.utc,
+            )
+        if match := _PLAIN_DATE.fullmatch(text):
+            year, month, day = match.groups()
+            return date(int(year), int(month), int(day))
+    except ValueError as exc:
+        raise _UnsupportedFrontmatter from exc
+    raise _UnsupportedFrontmatter
+
+
+def _parse_frontmatter_subset(text: str) -> dict[str, Any]:
+    metadata: dict[str, Any] = {}
+    items: list[Any] | None = None
+    item_indent: int | None = None
+    for line in text.splitlines():
+        stripped = line.lstrip(" ")
+        if stripped.startswith("- ") and items is not None:
+            # Items of one list must line up; deeper lines continue a scalar.
+            indent = len(line) - len(stripped)
+            if item_indent is None:
+                item_indent = indent
+            elif indent != item_indent:
+                raise _UnsupportedFrontmatter
+            items.append(_parse_plain_scalar(stripped[2:]))
+            continue
+        key, separator, value = line.partition(":")
+        if not separator or not _FRONTMATTER_KEY.fullmatch(key) or key in metadata:
+            raise _UnsupportedFrontmatter
+        # Keys resolve like values, so `on:` or `null:` is not a string key.
+        if key.lower() in _YAML_RESERVED_WORDS:
+            raise _UnsupportedFrontmatter
+        if value:
+            if not value.startswith(" "):
+                raise _UnsupportedFrontmatter
+            metadata[key] = _parse_plain_scalar(value[1:])
+            items = None
+        else:
+            items = metadata[key] = []
+            item_indent = None
+    # A bare `key:` without items is null in YAML, not an empty list.
+    return {key: value if value != [] else None for key, value in metadata.items()}
+
+
+def _parse_frontmatter(text: str) -> Any:
+    """Parse entry frontmatter, skipping the YAML loader for the common subset."""
+    try:
+        return _parse_frontmatter_subset(text)
+    except _UnsupportedFrontmatter:
+        return load_yaml(text)
+
+
 def read_entry(path: Path) -> Entry:
     """Parse a markdown entry file with YAML frontmatter."""
-    content = path.read_text(encoding="utf-8")
-    if not content.startswith("---"):
+    data = path.read_bytes()
+    if not data.startswith(b"---"):
         raise ValueError(f"Entry {path} missing YAML frontmatter")
 
-    _, _, remainder = content.partition("---\n")
-    frontmatter, _, body = remainder.partition("\n---\n")
-    metadata = yaml.safe_load(frontmatter) or {}
-    _normalize_created_metadata(metadata)
-    _normalize_legacy_list_metadata(metadata, "pr", "prs")
-    _normalize_legacy_list_metadata(metadata, "author", "authors")
-    _normalize_legacy_list_metadata(metadata, "component", "components")
+    frontmatter, body = _split_frontmatter(data)
+    metadata = (_parse_frontmatter(frontmatter) or {}) if frontmatter.strip() else {}
+    _normalize_entry_metadata(metadata)
     entry_id = path.stem
     return Entry(
         entry_id=entry_id,
@@ -123,10 +260,7 @@ def read_entry(path: Path) -> Entry:
 
 def iter_entries(project_root: Path) -> Iterable[Entry]:
     """Yield changelog entries from disk."""
-    directory = entry_directory(project_root)
-    if not directory.exists():
-        return
-    for path in sorted(directory.glob("*.md")):
+    for path in list_entry_files(entry_directory(project_root)):
         try:
             yield read_entry(path)
         except yaml.YAMLError as exc:
@@ -145,8 +279,7 @@ def _entry_sort_key(entry: Entry) -> tuple[datetime, str]:
     Orders by created datetime (ascending) with entry_id as tie-breaker.
     Entries without a created datetime sort to the beginning (epoch).
     """
-    created = entry.created_at or datetime.min.replace(tzinfo=timezone.utc)
-    return created, entry.entry_id
+    return entry.created_at or _MIN_CREATED, entry.entry_id
 
 
 def sort_entries_desc(entries: Iterable[Entry]) -> list[Entry]:
@@ -169,7 +302,7 @@ def _coerce_project(value: Any, *, source: str) -> Optional[str]:
         stripped = value.strip()
         return stripped or None
     if isinstance(value, (list, tuple, set)):
-        normalized = [str(item).strip() for item in value if str(item).strip()]
+        normalized = [text for item in value if (text := _strip_text(item))]
         if not normalized:
             return None
         if len(normalized) > 1:
@@ -193,6 +326,7 @@ def normalize_project(
         metadata.pop("project", None)
         return None
 
+    project = sys.intern(project)
     metadata["project"] = project
     return project
 
@@ -221,19 +355,42 @@ def _normalize_created_metadata(
     raise ValueError(f"Invalid created datetime value: {raw_created!r}")
 
 
-def _normalize_legacy_list_metadata(
-    metadata: dict[str, Any], singular_key: str, plural_key: str
+_LEGACY_LIST_KEYS = {"pr": "prs", "author": "authors", "component": "components"}
+_LIST_KEYS = ("prs", "authors", "components")
+
+
+def _normalize_entry_metadata(
+    metadata: dict[str, Any],
+    *,
+    default_now: bool = False,
 ) -> None:
-    """Normalize a singular legacy metadata key to its plural canonical key."""
-    if singular_key in metadata:
+    """Normalize list and created metadata in place.
+
+    Singular legacy keys are renamed to their plural canonical keys in a single
+    pass over the metadata. Renamed keys are appended in a fixed order so that
+    rendered frontmatter stays stable. Repeated strings (type, authors,
+    components, project) are interned so large entry sets share storage.
+    """
+    entry_type = metadata.get("type")
+    if isinstance(entry_type, str):
+        metadata["type"] = sys.intern(entry_type)
+    renamed: dict[str, Any] = {}
+    for key in list(metadata):
+        plural_key = _LEGACY_LIST_KEYS.get(key)
+        if plural_key is None:
+            continue
         if plural_key in metadata:
             raise ValueError(
-                f"Entry cannot have both '{singular_key}' and '{plural_key}' keys; use one or the other."
+                f"Entry cannot have both '{key}' and '{plural_key}' keys; use one or the other."
             )
-        value = metadata.pop(singular_key)
+        value = metadata.pop(key)
         if value is not None:
-            metadata[plural_key] = value
-    _normalize_list_metadata(metadata, plural_key)
+            renamed[plural_key] = value
+    for key in _LIST_KEYS:
+        if key in renamed:
+            metadata[key] = renamed[key]
+        _normalize_list_metadata(metadata, key)
+    _normalize_created_metadata(metadata, default_now=default_now)
 
 
 def _normalize_list_metadata(metadata: dict[str, Any], key: str) -> None:
@@ -247,10 +404,12 @@ def _normalize_list_metadata(metadata: dict[str, Any], key: str) -> None:
     if not isinstance(value, list):
         value = [value]
     if key == "prs":
-        normalized = [item for item in value if str(item).strip()]
+        normalized = [item for item in value if _strip_text(item)]
     else:
         normalized = [
-            item.strip() if isinstance(item, str) else item for item in value if str(item).strip()
+            sys.intern(text) if isinstance(item, str) else item
+            for item in value
+            if (text := _strip_text(item))
         ]
     if normalized:
         metadata[key] = normalized
@@ -266,20 +425,24 @@ class _IndentedDumper(yaml.SafeDumper):
         return super().increase_indent(flow=flow, indentless=False)
 
 
-def format_frontmatter(metadata: dict[str, Any]) -> str:
-    """Render metadata as YAML frontmatter for an entry file."""
-    cleaned: dict[str, Any] = {}
-    for key, value in metadata.items():
-        if value is None:
-            continue
-        cleaned[key] = value
-    yaml_block = yaml.dump(
-        cleaned,
+# Representers live on yaml.SafeDumper (see releases.py) and are inherited by
+# _IndentedDumper, so only the fixed dump options need binding here.
+_dump_frontmatter = cast(
+    Callable[[Any], str],
+    functools.partial(
+        yaml.dump,
         Dumper=_IndentedDumper,
         sort_keys=False,
         default_flow_style=False,
         indent=2,
-    ).strip()
+    ),
+)
+
+
+def format_frontmatter(metadata: dict[str, Any]) -> str:
+    """Render metadata as YAML frontmatter for an entry file."""
+    cleaned = {key: value for key, value in metadata.items() if value is not None}
+    yaml_block = _dump_frontmatter(cleaned).strip()
     return f"---\n{yaml_block}\n---\n"
 
 
@@ -302,9 +465,7 @@ def write_entry(
     project_value = normalize_project(metadata, default=default_project)
     if default_project is not None and project_value == default_project:
         metadata.pop("project", None)
-    _normalize_legacy_list_metadata(metadata, "pr", "prs")
-    _normalize_legacy_list_metadata(metadata, "author", "authors")
-    _normalize_legacy_list_metadata(metadata, "component", "components")
+    _normalize_entry_metadata(metadata, default_now=True)
 
     if entry_id is None:
         title = metadata.get("title")
@@ -313,18 +474,20 @@ def write_entry(
         entry_id = generate_entry_id(title)
 
     path = directory / f"{entry_id}.md"
-    if path.exists():
+    payload = format_frontmatter(metadata).encode("utf-8")
+    if body:
+        payload += b"\n" + body.strip().encode("utf-8") + b"\n"
+
+    # O_EXCL makes the existence check and file creation a single atomic step.
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError as exc:
         raise ValueError(
             f"An entry with id '{entry_id}' already exists. "
             "Please use a different title to generate a unique entry id."
-        )
-
-    _normalize_created_metadata(metadata, default_now=True)
-    frontmatter = format_frontmatter(metadata)
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write(frontmatter)
-        if body:
-            handle.write("\n" + body.strip() + "\n")
+        ) from exc
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(payload)
     return path
 
 
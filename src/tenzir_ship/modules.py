@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterator
 
@@ -21,6 +23,11 @@ class Module:
     config: "Config"  # Module's loaded config
     relative_path: str  # Path relative to parent (for display)
 
+    @functools.cached_property
+    def resolved_root(self) -> Path:
+        """Return the module root with symlinks resolved, computed once."""
+        return Path(os.path.realpath(self.root))
+
 
 def discover_modules(parent_root: Path, glob_pattern: str) -> Iterator[Module]:
     """Discover modules matching glob pattern relative to parent.
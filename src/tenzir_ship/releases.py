@@ -4,16 +4,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
+import os
 from pathlib import Path
 import re
 import shutil
-from typing import Iterable, Optional
+from typing import Any, Iterable, Optional
 
 from packaging.version import InvalidVersion, Version
 import yaml
 from yaml.nodes import Node
 
-from .entries import Entry, read_entry
+from .entries import Entry, list_entry_files, read_entry
+from .utils import load_yaml
 
 
 def _represent_date(dumper: yaml.SafeDumper, data: date) -> Node:
@@ -49,6 +51,7 @@ def _represent_folded_string(dumper: yaml.SafeDumper, data: _FoldedString) -> No
 yaml.SafeDumper.add_representer(_FoldedString, _represent_folded_string)
 
 NOTES_FILENAME = "notes.md"
+MANIFEST_FILENAME = "manifest.yaml"
 RELEASE_DIR = Path("releases")
 _RELEASE_VERSION_PATTERN = re.compile(
     r"^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)"
@@ -93,6 +96,18 @@ def release_directory(project_root: Path) -> Path:
     return project_root / RELEASE_DIR
 
 
+def release_manifest_paths(project_root: Path) -> list[Path]:
+    """Return existing release manifest paths, sorted by release directory name."""
+    directory = release_directory(project_root)
+    try:
+        with os.scandir(directory) as it:
+            names = sorted(item.name for item in it if item.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    paths = (directory / name / MANIFEST_FILENAME for name in names)
+    return [path for path in paths if path.exists()]
+
+
 def normalize_release_version(version: str) -> str:
     """Return a bare semantic version string without a leading tag prefix."""
     normalized_version = version.strip()
@@ -186,16 +201,18 @@ def _parse_release_source(raw_value: object | None) -> ReleaseSource | None:
     )
 
 
-def iter_release_manifests(project_root: Path) -> Iterable[ReleaseManifest]:
-    """Yield release manifests from disk."""
-    directory = release_directory(project_root)
-    if not directory.exists():
-        return
+def load_release_manifest_data(path: Path) -> Any:
+    """Parse a manifest file and return its raw YAML payload.
+
+    Empty manifests yield an empty mapping. YAML errors propagate.
+    """
+    return load_yaml(path.read_bytes()) or {}
 
-    manifest_paths = sorted(directory.glob("*/manifest.yaml"))
 
-    for path in manifest_paths:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+def iter_release_manifests(project_root: Path) -> Iterable[ReleaseManifest]:
+    """Yield release manifests from disk."""
+    for path in release_manifest_paths(project_root):
+        data = load_release_manifest_data(path)
 
         raw_intro = str(data.get("intro", "") or "").strip()
         created_value = _parse_created_date(data.get("created"))
@@ -223,8 +240,7 @@ def iter_release_manifests(project_root: Path) -> Iterable[ReleaseManifest]:
         if isinstance(entry_values, list) and entry_values:
             manifest.entries = [str(entry_id) for entry_id in entry_values]
         else:
-            entries_dir = path.parent / "entries"
-            entry_files = sorted(entries_dir.glob("*.md"))
+            entry_files = list_entry_files(path.parent / "entries")
             manifest.entries = [entry_file.stem for entry_file in entry_files]
         yield manifest
 
@@ -285,7 +301,7 @@ def write_release_manifest(
     release_dir = release_manifest_root(project_root, manifest)
     if not release_dir.exists():
         release_dir.mkdir(parents=True, exist_ok=False)
-    manifest_path = release_dir / "manifest.yaml"
+    manifest_path = release_dir / MANIFEST_FILENAME
     if manifest_path.exists() and not overwrite:
         raise FileExistsError(f"Release manifest {manifest_path} already exists")
 
@@ -305,21 +321,27 @@ def resolve_release_entry_path(
     project_root: Path, manifest: ReleaseManifest, entry_id: str
 ) -> Path | None:
     """Return the path to an entry file belonging to a release, if present."""
-    root = release_manifest_root(project_root, manifest)
-    entry_path = root / "entries" / f"{entry_id}.md"
+    entry_path = _release_entry_path(project_root, manifest, entry_id)
     if entry_path.exists():
         return entry_path
     return None
 
 
+def _release_entry_path(project_root: Path, manifest: ReleaseManifest, entry_id: str) -> Path:
+    return release_manifest_root(project_root, manifest) / "entries" / f"{entry_id}.md"
+
+
 def load_release_entry(
     project_root: Path, manifest: ReleaseManifest, entry_id: str
 ) -> Entry | None:
-    """Load a release entry as an Entry instance."""
-    entry_path = resolve_release_entry_path(project_root, manifest, entry_id)
-    if entry_path is None:
+    """Load a release entry as an Entry instance.
+
+    The entry file is opened directly; a missing file yields ``None``.
+    """
+    try:
+        entry = read_entry(_release_entry_path(project_root, manifest, entry_id))
+    except FileNotFoundError:
         return None
-    entry = read_entry(entry_path)
     entry.release = render_release_tag(manifest.version)
     return entry
 
@@ -11,10 +11,11 @@ import sys
 from datetime import date, datetime, timezone
 from pathlib import Path
 from collections.abc import Iterable as IterableABC
-from typing import Iterable, Mapping, Optional, cast, NoReturn
+from typing import IO, Any, Iterable, Mapping, Optional, cast, NoReturn
 
 import mdformat
 import click
+import yaml
 from rich.console import Console, RenderableType
 from rich.style import Style
 from rich.theme import Theme
@@ -36,6 +37,15 @@ RESET = "\033[0m"
 _LOGGER_NAME = "tenzir_ship"
 _LOGGER = logging.getLogger(_LOGGER_NAME)
 
+# `\w` matches exactly the characters for which str.isalnum() holds, plus "_".
+_SLUG_DROPPED_CHARS = re.compile(r"[^\w \-]")
+_SLUG_SEPARATOR_RUNS = re.compile(r"[ _\-]+")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_LINE_BREAK = re.compile(r"\s*\n\s*")
+
+# Prefer the libyaml-backed loader; it constructs the same safe Python objects.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 console = Console(
     stderr=True,
     theme=Theme(
@@ -171,6 +181,11 @@ def coerce_datetime(value: object) -> Optional[datetime]:
         return None
 
 
+def load_yaml(stream: str | bytes | IO[str]) -> Any:
+    """Parse YAML with the safe loader, using libyaml when it is available."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
 def guess_git_remote(project_root: Path) -> Optional[str]:
     """Return the GitHub repository slug (owner/name) if available."""
     try:
@@ -201,15 +216,8 @@ def guess_git_remote(project_root: Path) -> Optional[str]:
 
 def slugify(value: str) -> str:
     """Generate a safe slug for filesystem or identifier usage."""
-    safe_chars = []
-    for char in value.lower():
-        if char.isalnum():
-            safe_chars.append(char)
-        elif char in {" ", "-", "_"}:
-            safe_chars.append("-")
-    slug = "".join(safe_chars)
-    while "--" in slug:
-        slug = slug.replace("--", "-")
+    kept = _SLUG_DROPPED_CHARS.sub("", value.lower())
+    slug = _SLUG_SEPARATOR_RUNS.sub("-", kept)
     return slug.strip("-") or "project"
 
 
@@ -381,8 +389,8 @@ def extract_excerpt(text: str) -> str:
     stripped = text.strip()
     if not stripped:
         return ""
-    first_paragraph, *_ = re.split(r"\n\s*\n", stripped, maxsplit=1)
-    collapsed = re.sub(r"\s*\n\s*", " ", first_paragraph.strip())
+    first_paragraph, *_ = _PARAGRAPH_BREAK.split(stripped, maxsplit=1)
+    collapsed = _LINE_BREAK.sub(" ", first_paragraph.strip())
     return collapsed.strip()
 
 
@@ -6,11 +6,11 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from importlib import resources
 import json
+from operator import attrgetter
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, cast
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, cast
 
-from jsonschema import Draft202012Validator, FormatChecker
-from jsonschema.exceptions import ValidationError
 import yaml
 
 from .config import Config
@@ -19,15 +19,24 @@ from .releases import (
     ReleaseManifest,
     iter_release_manifests,
     load_release_entry,
+    load_release_manifest_data,
+    release_manifest_paths,
+    release_manifest_root,
     resolve_release_entry_path,
 )
 
 if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import ValidationError
+
     from .modules import Module
 
 
 _ALLOWED_CHANGELOG_ROOT_ITEMS = {"config.yaml", "unreleased", "releases"}
 _ALLOWED_RELEASE_ITEMS = {"manifest.yaml", "notes.md", "entries"}
+_ALLOWED_ROOT_ITEMS_HINT = "Allowed: config.yaml, unreleased, releases."
+_ALLOWED_RELEASE_ITEMS_HINT = "Allowed: manifest.yaml, notes.md, entries."
+_MARKDOWN_ONLY_HINT = "Only Markdown (*.md) files are allowed."
 _ALLOWED_ENTRY_METADATA_KEYS = {
     "authors",
     "components",
@@ -43,6 +52,7 @@ _RELEASE_MANIFEST_SCHEMA_PATH = _SCHEMA_DIR / "release-manifest.schema.json"
 _ENTRY_SCHEMA_VALIDATOR: Draft202012Validator | None = None
 _RELEASE_MANIFEST_SCHEMA_VALIDATOR: Draft202012Validator | None = None
 MISSING_PR_CODE = "missing-pr"
+_DIR_ENTRY_NAME = attrgetter("name")
 
 
 @dataclass
@@ -55,64 +65,87 @@ class ValidationIssue:
     code: str | None = None
 
 
-def _iter_non_hidden_children(directory: Path) -> Iterable[Path]:
-    """Yield non-hidden direct children of a directory in deterministic order."""
-    if not directory.exists() or not directory.is_dir():
+def _iter_non_hidden_children_unsorted(directory: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield non-hidden direct children of a directory in scan order.
+
+    Children are ``os.DirEntry`` objects so that type checks reuse the data
+    gathered while scanning instead of issuing a ``stat`` per child.
+    """
+    try:
+        scan = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
         return
-    for child in sorted(directory.iterdir(), key=lambda path: path.name):
-        if child.name.startswith("."):
-            continue
-        yield child
+    with scan:
+        for child in scan:
+            if not child.name.startswith("."):
+                yield child
+
+
+def _iter_non_hidden_children(directory: Path) -> list[os.DirEntry[str]]:
+    """Return non-hidden direct children of a directory in deterministic order."""
+    return sorted(_iter_non_hidden_children_unsorted(directory), key=_DIR_ENTRY_NAME)
+
+
+def _unexpected_markdown_dir_children(directory: Path) -> list[os.DirEntry[str]]:
+    """Return children of an entries directory that are not Markdown files.
+
+    Only the (usually empty) set of offending children is sorted, not the
+    whole directory listing.
+    """
+    unexpected = [
+        child
+        for child in _iter_non_hidden_children_unsorted(directory)
+        if not (child.name.endswith(".md") and child.is_file())
+    ]
+    unexpected.sort(key=_DIR_ENTRY_NAME)
+    return unexpected
 
 
 def _validate_changelog_structure(project_root: Path) -> list[ValidationIssue]:
     """Validate on-disk changelog directory layout for a project root."""
     issues: list[ValidationIssue] = []
 
-    # Check root-level allowed items.
-    for child in _iter_non_hidden_children(project_root):
+    # Check root-level allowed items. The scan doubles as the existence and
+    # type check for config.yaml, unreleased, and releases below.
+    root_children = {child.name: child for child in _iter_non_hidden_children(project_root)}
+    for child in root_children.values():
         if child.name in _ALLOWED_CHANGELOG_ROOT_ITEMS:
             continue
         issues.append(
             ValidationIssue(
-                child,
-                (
-                    f"Unexpected item in changelog root: '{child.name}'. "
-                    "Allowed: config.yaml, unreleased, releases."
-                ),
+                Path(child.path),
+                f"Unexpected item in changelog root: '{child.name}'. {_ALLOWED_ROOT_ITEMS_HINT}",
             )
         )
 
-    config_path = project_root / "config.yaml"
-    if config_path.exists() and not config_path.is_file():
-        issues.append(ValidationIssue(config_path, "'config.yaml' must be a file."))
+    config_entry = root_children.get("config.yaml")
+    if config_entry is not None and not config_entry.is_file():
+        issues.append(ValidationIssue(Path(config_entry.path), "'config.yaml' must be a file."))
 
-    unreleased_dir = project_root / "unreleased"
-    if unreleased_dir.exists():
-        if not unreleased_dir.is_dir():
+    unreleased_entry = root_children.get("unreleased")
+    if unreleased_entry is not None:
+        unreleased_dir = Path(unreleased_entry.path)
+        if not unreleased_entry.is_dir():
             issues.append(ValidationIssue(unreleased_dir, "'unreleased' must be a directory."))
         else:
-            for child in _iter_non_hidden_children(unreleased_dir):
-                if child.is_file() and child.suffix == ".md":
-                    continue
+            for child in _unexpected_markdown_dir_children(unreleased_dir):
                 issues.append(
                     ValidationIssue(
-                        child,
-                        (
-                            f"Unexpected item in 'unreleased/': '{child.name}'. "
-                            "Only Markdown (*.md) files are allowed."
-                        ),
+                        Path(child.path),
+                        f"Unexpected item in 'unreleased/': '{child.name}'. {_MARKDOWN_ONLY_HINT}",
                     )
                 )
 
-    releases_dir = project_root / "releases"
-    if releases_dir.exists():
-        if not releases_dir.is_dir():
+    releases_entry = root_children.get("releases")
+    if releases_entry is not None:
+        releases_dir = Path(releases_entry.path)
+        if not releases_entry.is_dir():
             issues.append(ValidationIssue(releases_dir, "'releases' must be a directory."))
             return issues
 
-        for release_dir in _iter_non_hidden_children(releases_dir):
-            if not release_dir.is_dir():
+        for release_child in _iter_non_hidden_children(releases_dir):
+            release_dir = Path(release_child.path)
+            if not release_child.is_dir():
                 issues.append(
                     ValidationIssue(
                         release_dir,
@@ -124,47 +157,53 @@ def _validate_changelog_structure(project_root: Path) -> list[ValidationIssue]:
                 )
                 continue
 
-            manifest_path = release_dir / "manifest.yaml"
-            if not manifest_path.exists():
+            # One scan per release drives the unexpected-item, manifest, notes,
+            # and entries checks.
+            members = _iter_non_hidden_children(release_dir)
+            members_by_name = {child.name: child for child in members}
+
+            manifest_entry = members_by_name.get("manifest.yaml")
+            if manifest_entry is None:
                 issues.append(
                     ValidationIssue(
-                        manifest_path,
+                        release_dir / "manifest.yaml",
                         f"Release '{release_dir.name}' is missing required file 'manifest.yaml'.",
                     )
                 )
-            elif not manifest_path.is_file():
+            elif not manifest_entry.is_file():
                 issues.append(
                     ValidationIssue(
-                        manifest_path,
+                        Path(manifest_entry.path),
                         f"Release '{release_dir.name}' has non-file 'manifest.yaml'.",
                     )
                 )
 
-            for child in _iter_non_hidden_children(release_dir):
+            for child in members:
                 if child.name in _ALLOWED_RELEASE_ITEMS:
                     continue
                 issues.append(
                     ValidationIssue(
-                        child,
+                        Path(child.path),
                         (
                             f"Unexpected item in release '{release_dir.name}/': '{child.name}'. "
-                            "Allowed: manifest.yaml, notes.md, entries."
+                            f"{_ALLOWED_RELEASE_ITEMS_HINT}"
                         ),
                     )
                 )
 
-            notes_path = release_dir / "notes.md"
-            if notes_path.exists() and not notes_path.is_file():
+            notes_entry = members_by_name.get("notes.md")
+            if notes_entry is not None and not notes_entry.is_file():
                 issues.append(
                     ValidationIssue(
-                        notes_path,
+                        Path(notes_entry.path),
                         f"Release '{release_dir.name}' has non-file 'notes.md'.",
                     )
                 )
 
-            entries_dir = release_dir / "entries"
-            if entries_dir.exists():
-                if not entries_dir.is_dir():
+            entries_entry = members_by_name.get("entries")
+            if entries_entry is not None:
+                entries_dir = Path(entries_entry.path)
+                if not entries_entry.is_dir():
                     issues.append(
                         ValidationIssue(
                             entries_dir,
@@ -172,16 +211,14 @@ def _validate_changelog_structure(project_root: Path) -> list[ValidationIssue]:
                         )
                     )
                 else:
-                    for child in _iter_non_hidden_children(entries_dir):
-                        if child.is_file() and child.suffix == ".md":
-                            continue
+                    for child in _unexpected_markdown_dir_children(entries_dir):
                         issues.append(
                             ValidationIssue(
-                                child,
+                                Path(child.path),
                                 (
                                     "Unexpected item in release "
                                     f"'{release_dir.name}/entries/': '{child.name}'. "
-                                    "Only Markdown (*.md) files are allowed."
+                                    f"{_MARKDOWN_ONLY_HINT}"
                                 ),
                             )
                         )
@@ -201,18 +238,28 @@ def run_structure_validation_with_modules(
     """Validate changelog structure for parent project and discovered modules."""
     issues = run_structure_validation(project_root)
     for module in modules:
-        for issue in run_structure_validation(module.root):
-            issues.append(
-                ValidationIssue(
-                    path=issue.path,
-                    message=f"[{module.config.id}] {issue.message}",
-                    severity=issue.severity,
-                    code=issue.code,
-                )
-            )
+        issues.extend(
+            _prefix_module_issues(module.config.id, run_structure_validation(module.root))
+        )
     return issues
 
 
+def _prefix_module_issues(
+    module_id: str, issues: Iterable[ValidationIssue]
+) -> list[ValidationIssue]:
+    """Return copies of issues with messages prefixed by the module ID."""
+    prefix = f"[{module_id}] "
+    return [
+        ValidationIssue(
+            path=issue.path,
+            message=prefix + issue.message,
+            severity=issue.severity,
+            code=issue.code,
+        )
+        for issue in issues
+    ]
+
+
 def _load_schema(path: Path) -> dict[str, Any]:
     if path.exists():
         return cast(dict[str, Any], json.loads(path.read_text(encoding="utf-8")))
@@ -223,6 +270,9 @@ def _load_schema(path: Path) -> dict[str, Any]:
 
 
 def _schema_validator(path: Path) -> Draft202012Validator:
+    # jsonschema is costly to import, so load it only once validation runs.
+    from jsonschema import Draft202012Validator, FormatChecker
+
     if path == _ENTRY_SCHEMA_PATH:
         global _ENTRY_SCHEMA_VALIDATOR
         if _ENTRY_SCHEMA_VALIDATOR is None:
@@ -330,7 +380,7 @@ def _validate_entry_metadata_schema(entry: Entry) -> Iterable[ValidationIssue]:
 
 def _validate_release_manifest_schema(path: Path) -> Iterable[ValidationIssue]:
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        data = load_release_manifest_data(path)
     except yaml.YAMLError as exc:
         yield ValidationIssue(path, f"Failed to parse release manifest YAML: {exc}")
         return
@@ -346,11 +396,8 @@ def _validate_release_manifest_schema(path: Path) -> Iterable[ValidationIssue]:
 
 
 def _validate_release_manifest_schemas(project_root: Path) -> list[ValidationIssue]:
-    manifests_dir = project_root / "releases"
-    if not manifests_dir.is_dir():
-        return []
     issues: list[ValidationIssue] = []
-    for manifest_path in sorted(manifests_dir.glob("*/manifest.yaml")):
+    for manifest_path in release_manifest_paths(project_root):
         if manifest_path.is_file():
             issues.extend(_validate_release_manifest_schema(manifest_path))
     return issues
@@ -391,11 +438,13 @@ def validate_entry(entry: Entry, config: Config) -> Iterable[ValidationIssue]:
             "Entry has 'authors' metadata but the config sets 'omit_author: true'. "
             "Remove the 'authors' field.",
         )
-    entry_components = entry.components
-    if entry_components and config.components:
-        unknown = [c for c in entry_components if c not in config.components]
+    # `config.components` is a dict, so membership checks are already hashed;
+    # only derive the entry's components when the config restricts them.
+    allowed_components = config.components
+    if allowed_components and (entry_components := entry.components):
+        unknown = [c for c in entry_components if c not in allowed_components]
         if unknown:
-            allowed = ", ".join(config.components)
+            allowed = ", ".join(allowed_components)
             unknown_display = ", ".join(f"'{c}'" for c in unknown)
             yield ValidationIssue(
                 entry.path,
@@ -422,12 +471,30 @@ def validate_release_ids(
     releases: Iterable[ReleaseManifest],
     project_root: Path,
     issues: list[ValidationIssue],
+    *,
+    known_entry_paths: frozenset[Path] = frozenset(),
 ) -> None:
-    """Ensure release manifests reference existing entry IDs."""
+    """Ensure release manifests reference existing entry IDs.
+
+    References to files in ``known_entry_paths``, typically the release entries
+    the caller already loaded, are accepted without checking the disk again.
+    """
     for manifest in releases:
+        if not manifest.entries:
+            continue
+        entries_dir = release_manifest_root(project_root, manifest) / "entries"
+        # Listed once per release, and only if some reference was not loaded.
+        entry_filenames: set[str] | None = None
         for entry_id in manifest.entries:
-            entry_path = resolve_release_entry_path(project_root, manifest, entry_id)
-            if entry_path is None:
+            filename = f"{entry_id}.md"
+            if entries_dir / filename in known_entry_paths:
+                continue
+            if entry_filenames is None:
+                try:
+                    entry_filenames = set(os.listdir(entries_dir))
+                except (FileNotFoundError, NotADirectoryError):
+                    entry_filenames = set()
+            if filename not in entry_filenames:
                 issues.append(
                     ValidationIssue(
                         manifest.path or Path(""),
@@ -436,17 +503,12 @@ def validate_release_ids(
                 )
 
 
-def run_validation(project_root: Path, config: Config) -> list[ValidationIssue]:
-    """Validate entries and releases, returning a list of issues."""
-    issues: list[ValidationIssue] = run_structure_validation(project_root)
-    issues.extend(_validate_release_manifest_schemas(project_root))
-    try:
-        releases = list(iter_release_manifests(project_root))
-    except (AttributeError, TypeError, ValueError, yaml.YAMLError) as exc:
-        issues.append(ValidationIssue(project_root / "releases", f"Failed to read releases: {exc}"))
-        releases = []
-    entries = list(iter_entries(project_root))
-    release_entries: list[Entry] = []
+def _iter_release_entries(
+    project_root: Path,
+    releases: Iterable[ReleaseManifest],
+    issues: list[ValidationIssue],
+) -> Iterator[Entry]:
+    """Yield readable release entries, recording read failures in ``issues``."""
     for manifest in releases:
         for entry_id in manifest.entries:
             try:
@@ -455,15 +517,37 @@ def run_validation(project_root: Path, config: Config) -> list[ValidationIssue]:
                 entry_path = resolve_release_entry_path(project_root, manifest, entry_id)
                 issues.append(ValidationIssue(entry_path or manifest.path or Path(""), str(exc)))
                 continue
-            if entry is None:
-                continue
-            release_entries.append(entry)
+            if entry is not None:
+                yield entry
+
 
-    all_entries = entries + release_entries
-    for entry in all_entries:
+def run_validation(project_root: Path, config: Config) -> list[ValidationIssue]:
+    """Validate entries and releases, returning a list of issues."""
+    issues: list[ValidationIssue] = run_structure_validation(project_root)
+    issues.extend(_validate_release_manifest_schemas(project_root))
+    try:
+        releases = list(iter_release_manifests(project_root))
+    except (AttributeError, TypeError, ValueError, yaml.YAMLError) as exc:
+        issues.append(ValidationIssue(project_root / "releases", f"Failed to read releases: {exc}"))
+        releases = []
+    # Validate entries as they are loaded so no Entry list outlives the pass.
+    # Release entry issues are buffered to keep them after unreleased ones.
+    release_issues: list[ValidationIssue] = []
+    release_entry_paths: set[Path] = set()
+    for entry in _iter_release_entries(project_root, releases, issues):
+        release_entry_paths.add(entry.path)
+        release_issues.extend(validate_entry(entry, config))
+
+    for entry in iter_entries(project_root):
         issues.extend(validate_entry(entry, config))
+    issues.extend(release_issues)
 
-    validate_release_ids(releases, project_root, issues)
+    validate_release_ids(
+        releases,
+        project_root,
+        issues,
+        known_entry_paths=frozenset(release_entry_paths),
+    )
     return issues
 
 
@@ -480,6 +564,9 @@ def validate_modules(
     """
     issues: list[ValidationIssue] = []
 
+    # Resolve the parent once; module roots cache their own resolution.
+    parent_resolved = Path(os.path.realpath(parent_root))
+
     # Check for duplicate module IDs
     seen_ids: dict[str, Path] = {config.id: parent_root}
     for module in modules:
@@ -496,7 +583,7 @@ def validate_modules(
             seen_ids[module_id] = module.root
 
         # Check that module doesn't reference parent (circular reference)
-        if module.root.resolve() == parent_root.resolve():
+        if module.resolved_root == parent_resolved:
             issues.append(
                 ValidationIssue(
                     parent_root,
@@ -521,21 +608,22 @@ def run_validation_with_modules(
     # Validate module configuration itself
     issues.extend(validate_modules(project_root, config, modules))
 
+    # Each changelog root is traversed at most once, even when several modules
+    # (or a module and the parent) resolve to the same directory.
+    parent_key = project_root.resolve()
+    targets: dict[Path, tuple[Path, Config]] = {parent_key: (project_root, config)}
+    for module in modules:
+        targets.setdefault(module.resolved_root, (module.root, module.config))
+    validated = {
+        key: run_validation(root, root_config) for key, (root, root_config) in targets.items()
+    }
+
     # Validate parent project
-    parent_issues = run_validation(project_root, config)
-    issues.extend(parent_issues)
+    issues.extend(validated[parent_key])
 
     # Validate each module
     for module in modules:
-        module_issues = run_validation(module.root, module.config)
         # Prefix issues with module ID for clarity
-        for issue in module_issues:
-            prefixed_issue = ValidationIssue(
-                path=issue.path,
-                message=f"[{module.config.id}] {issue.message}",
-                severity=issue.severity,
-                code=issue.code,
-            )
-            issues.append(prefixed_issue)
+        issues.extend(_prefix_module_issues(module.config.id, validated[module.resolved_root]))
 
     return issues
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 import shutil
 import subprocess
@@ -28,6 +30,24 @@ _VERSION_ASSIGNMENT_PATTERN = re.compile(
     r'^(?P<prefix>\s*version\s*=\s*)(?P<quote>["\'])(?P<value>[^"\']*)(?P=quote)'
     r"(?P<suffix>\s*(?:#.*)?)(?P<newline>\r?\n?)$"
 )
+# Whole-document variants of the two patterns above, anchored per line. They
+# stay within one line by excluding newlines from every repeated class.
+_TABLE_HEADER_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*(?:\[(?P<table>[^\]\n]+)\]|\[\[(?P<array_table>[^\]\n]+)\]\])"
+    r"[^\S\n]*(?:#[^\n]*)?$",
+    re.MULTILINE,
+)
+_VERSION_ASSIGNMENT_LINE_PATTERN = re.compile(
+    r'^[^\S\n]*version[^\S\n]*=[^\S\n]*(?P<quote>["\'])(?P<value>[^"\'\n]*)(?P=quote)'
+    r"[^\S\n]*(?:#[^\n]*)?$",
+    re.MULTILINE,
+)
+# Multiline strings and line breaks other than LF/CRLF need the line scanner.
+_TOML_LINE_SCAN_REQUIRED_PATTERN = re.compile(
+    r"\"\"\"|'''|[\v\f\x1c-\x1e\x85\u2028\u2029]|\r(?!\n)"
+)
+_JSON_TOKEN_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_JSON_STRING_VALUE_PATTERN = re.compile(r'\s*:\s*("(?:[^"\\]|\\.)*")')
 
 
 def _is_toml_basic_quote_escaped(line: str, quote_index: int) -> bool:
@@ -141,6 +161,7 @@ class _ResolvedVersionFileTarget:
     explicit: bool
 
 
+@functools.lru_cache(maxsize=128)
 def _strip_release_prefix(version: str) -> str:
     """Convert release labels like v1.2.3 into package-manager version strings."""
 
@@ -167,6 +188,32 @@ def _auto_search_roots(project_root: Path) -> list[Path]:
     return roots
 
 
+def _list_root_files(root: Path) -> dict[str, bool]:
+    """Map names of regular files (or links to them) in root to whether they are links."""
+    try:
+        with os.scandir(root) as scan:
+            return {child.name: child.is_symlink() for child in scan if child.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _root_file_link_state(root: Path, filename: str, files: dict[str, bool]) -> bool | None:
+    """Return whether a root file is a link, or None when it does not exist.
+
+    Names match exactly first. A listed name that differs only in case also
+    matches when the filesystem opens it under ``filename``, as on
+    case-insensitive macOS and Windows volumes.
+    """
+    is_symlink = files.get(filename)
+    if is_symlink is not None:
+        return is_symlink
+    folded = filename.casefold()
+    for name, name_is_symlink in files.items():
+        if name.casefold() == folded and (root / filename).is_file():
+            return name_is_symlink
+    return None
+
+
 def resolve_version_file_targets(project_root: Path, explicit_paths: Sequence[str]) -> list[Path]:
     """Resolve configured or auto-detected version file paths in deterministic order."""
 
@@ -177,78 +224,136 @@ def resolve_version_file_targets(project_root: Path, explicit_paths: Sequence[st
 def _resolve_version_file_targets(
     project_root: Path, explicit_paths: Sequence[str]
 ) -> list[_ResolvedVersionFileTarget]:
-    candidates: list[_ResolvedVersionFileTarget] = []
+    # Dicts keep insertion order, so the first occurrence fixes the position;
+    # an explicit entry still wins over an implicit one for the same path.
+    deduped: dict[Path, _ResolvedVersionFileTarget] = {}
     if explicit_paths:
         for raw_path in explicit_paths:
-            candidates.append(
-                _ResolvedVersionFileTarget(
-                    path=_resolve_explicit_version_file_path(project_root, raw_path),
-                    explicit=True,
-                )
-            )
+            path = _resolve_explicit_version_file_path(project_root, raw_path)
+            existing = deduped.get(path)
+            if existing is None or not existing.explicit:
+                deduped[path] = _ResolvedVersionFileTarget(path=path, explicit=True)
     else:
         for root in _auto_search_roots(project_root):
+            files = _list_root_files(root)
             for filename in SUPPORTED_AUTO_VERSION_FILES:
-                filepath = root / filename
-                if filepath.is_file():
-                    candidates.append(
-                        _ResolvedVersionFileTarget(path=filepath.resolve(), explicit=False)
-                    )
-
-    deduped: list[_ResolvedVersionFileTarget] = []
-    seen: dict[Path, int] = {}
-    for candidate in candidates:
-        existing_index = seen.get(candidate.path)
-        if existing_index is not None:
-            if candidate.explicit and not deduped[existing_index].explicit:
-                deduped[existing_index] = _ResolvedVersionFileTarget(
-                    path=candidate.path,
-                    explicit=True,
-                )
-            continue
-        seen[candidate.path] = len(deduped)
-        deduped.append(candidate)
-    return deduped
+                is_symlink = _root_file_link_state(root, filename, files)
+                if is_symlink is not None:
+                    # Roots are already resolved, so only links need resolving.
+                    path = root / filename
+                    if is_symlink:
+                        path = path.resolve()
+                    deduped.setdefault(path, _ResolvedVersionFileTarget(path=path, explicit=False))
+    return list(deduped.values())
 
 
 def _replace_toml_table_version(
     content: str, table_name: str, new_version: str
 ) -> _TomlUpdateResult:
-    lines = content.splitlines(keepends=True)
-    active = False
-    found_table = False
-    found_version = False
-    changed = False
-    old_version: str | None = None
+    return _replace_toml_tables_version(content, (table_name,), new_version)[table_name]
+
+
+def _replace_toml_tables_version(
+    content: str, table_names: tuple[str, ...], new_version: str
+) -> dict[str, _TomlUpdateResult]:
+    """Locate the version assignment of several TOML tables in one pass.
+
+    Tables are listed in priority order: the scan may stop as soon as the first
+    table's version is found, since callers then ignore the remaining tables.
+    """
+    if _TOML_LINE_SCAN_REQUIRED_PATTERN.search(content) is None:
+        found_tables, versions = _locate_toml_versions_by_region(content, table_names)
+    else:
+        found_tables, versions = _locate_toml_versions_by_line(content, table_names)
+
+    results: dict[str, _TomlUpdateResult] = {}
+    for table_name in table_names:
+        located = versions.get(table_name)
+        if located is None:
+            results[table_name] = _TomlUpdateResult(
+                found_table=table_name in found_tables,
+                found_version=False,
+                old_version=None,
+                changed=False,
+                content=content,
+            )
+            continue
+        value_start, value_end = located
+        old_version = content[value_start:value_end]
+        changed = old_version != new_version
+        results[table_name] = _TomlUpdateResult(
+            found_table=True,
+            found_version=True,
+            old_version=old_version,
+            changed=changed,
+            # Splice the rewritten value in place of the old one.
+            content=(
+                content[:value_start] + new_version + content[value_end:] if changed else content
+            ),
+        )
+    return results
+
+
+def _locate_toml_versions_by_region(
+    content: str, table_names: tuple[str, ...]
+) -> tuple[set[str], dict[str, tuple[int, int]]]:
+    """Find table version spans with whole-document regex scans.
+
+    Only valid when the content has no multiline strings, so that every line
+    matching the header pattern really is a table header.
+    """
+    headers = list(_TABLE_HEADER_LINE_PATTERN.finditer(content))
+    found_tables: set[str] = set()
+    versions: dict[str, tuple[int, int]] = {}
+    for index, header in enumerate(headers):
+        table_name = (header.group("table") or header.group("array_table") or "").strip()
+        if table_name not in table_names:
+            continue
+        found_tables.add(table_name)
+        if table_name in versions:
+            continue
+        region_end = headers[index + 1].start() if index + 1 < len(headers) else len(content)
+        version_match = _VERSION_ASSIGNMENT_LINE_PATTERN.search(content, header.end(), region_end)
+        if version_match is not None:
+            versions[table_name] = version_match.span("value")
+    return found_tables, versions
+
+
+def _locate_toml_versions_by_line(
+    content: str, table_names: tuple[str, ...]
+) -> tuple[set[str], dict[str, tuple[int, int]]]:
+    """Find table version spans line by line, skipping multiline strings."""
+    match_table = _TABLE_PATTERN.match
+    match_version = _VERSION_ASSIGNMENT_PATTERN.match
+    active_table: str | None = None
+    found_tables: set[str] = set()
+    versions: dict[str, tuple[int, int]] = {}
     in_multiline_basic_string = False
     in_multiline_literal_string = False
+    offset = 0
 
-    for index, line in enumerate(lines):
+    for line in content.splitlines(keepends=True):
         inside_multiline_string = in_multiline_basic_string or in_multiline_literal_string
-        stripped = line.rstrip("\r\n")
         if not inside_multiline_string:
-            table_match = _TABLE_PATTERN.match(stripped)
+            table_match = match_table(line.rstrip("\r\n"))
             if table_match:
                 current_table = (
                     table_match.group("table") or table_match.group("array_table") or ""
                 ).strip()
-                if current_table == table_name:
-                    active = True
-                    found_table = True
-                elif active:
-                    active = False
-            elif active and not found_version:
-                version_match = _VERSION_ASSIGNMENT_PATTERN.match(line)
+                if current_table in table_names:
+                    active_table = current_table
+                    found_tables.add(current_table)
+                else:
+                    active_table = None
+            elif active_table is not None and active_table not in versions:
+                version_match = match_version(line)
                 if version_match is not None:
-                    found_version = True
-                    old_version = version_match.group("value")
-                    if old_version != new_version:
-                        changed = True
-                        lines[index] = (
-                            f"{version_match.group('prefix')}"
-                            f"{version_match.group('quote')}{new_version}{version_match.group('quote')}"
-                            f"{version_match.group('suffix')}{version_match.group('newline')}"
-                        )
+                    versions[active_table] = (
+                        offset + version_match.start("value"),
+                        offset + version_match.end("value"),
+                    )
+                    if active_table == table_names[0] or len(versions) == len(table_names):
+                        break
 
         (
             in_multiline_basic_string,
@@ -258,17 +363,9 @@ def _replace_toml_table_version(
             in_multiline_basic_string=in_multiline_basic_string,
             in_multiline_literal_string=in_multiline_literal_string,
         )
+        offset += len(line)
 
-        if found_version:
-            break
-
-    return _TomlUpdateResult(
-        found_table=found_table,
-        found_version=found_version,
-        old_version=old_version,
-        changed=changed,
-        content="".join(lines),
-    )
+    return found_tables, versions
 
 
 def _load_json_object(path: Path, content: str) -> dict[str, object]:
@@ -287,6 +384,26 @@ def _dump_json_object(parsed: dict[str, object]) -> str:
     return json.dumps(parsed, indent=2, ensure_ascii=False) + "\n"
 
 
+def _find_top_level_json_version(content: str) -> tuple[int, int] | None:
+    """Return the span of the top-level ``"version"`` string value, if any.
+
+    Like ``json.loads``, the last occurrence wins when the key is duplicated.
+    """
+    span: tuple[int, int] | None = None
+    depth = 0
+    for token in _JSON_TOKEN_PATTERN.finditer(content):
+        text = token.group()
+        if text in ("{", "["):
+            depth += 1
+        elif text in ("}", "]"):
+            depth -= 1
+        elif depth == 1 and text == '"version"':
+            value = _JSON_STRING_VALUE_PATTERN.match(content, token.end())
+            if value is not None:
+                span = value.span(1)
+    return span
+
+
 def _update_package_json(
     path: Path,
     content: str,
@@ -310,8 +427,14 @@ def _update_package_json(
     if old_value == new_version:
         return content, old_value
 
-    parsed["version"] = new_version
-    return _dump_json_object(parsed), old_value
+    # Rewrite only the top-level value so the rest of the file keeps its
+    # formatting; fall back to re-serializing when it cannot be located.
+    span = _find_top_level_json_version(content)
+    if span is None:
+        parsed["version"] = new_version
+        return _dump_json_object(parsed), old_value
+    start, end = span
+    return content[:start] + json.dumps(new_version, ensure_ascii=False) + content[end:], old_value
 
 
 def _update_package_lock_json(
@@ -372,12 +495,13 @@ def _update_pyproject_like(
     *,
     skip_if_missing_static_version: bool,
 ) -> tuple[str, str | None]:
-    project_update = _replace_toml_table_version(content, "project", new_version)
+    updates = _replace_toml_tables_version(content, ("project", "tool.poetry"), new_version)
+    project_update = updates["project"]
     if project_update.found_table:
         if project_update.found_version:
             return project_update.content, project_update.old_version
 
-    poetry_update = _replace_toml_table_version(content, "tool.poetry", new_version)
+    poetry_update = updates["tool.poetry"]
     if poetry_update.found_table:
         if poetry_update.found_version:
             return poetry_update.content, poetry_update.old_version
@@ -404,13 +528,12 @@ def _update_cargo_toml(
     *,
     skip_if_missing_static_version: bool,
 ) -> tuple[str, str | None]:
-    package_update = _replace_toml_table_version(content, "package", new_version)
+    updates = _replace_toml_tables_version(content, ("package", "workspace.package"), new_version)
+    package_update = updates["package"]
     if package_update.found_table and package_update.found_version:
         return package_update.content, package_update.old_version
 
-    workspace_package_update = _replace_toml_table_version(
-        content, "workspace.package", new_version
-    )
+    workspace_package_update = updates["workspace.package"]
     if workspace_package_update.found_table and workspace_package_update.found_version:
         return workspace_package_update.content, workspace_package_update.old_version
 
@@ -426,21 +549,29 @@ def _update_cargo_toml(
     raise click.ClickException(f"{path} is missing a [package] table.")
 
 
-def _version_file_kind(path: Path) -> Literal["package_json", "pyproject", "cargo"]:
-    name = path.name
+_VersionFileKind = Literal["package_json", "pyproject", "cargo"]
+
+
+@functools.lru_cache(maxsize=64)
+def _version_file_kind_for_name(name: str) -> _VersionFileKind | None:
     lowered = name.lower()
     if lowered == "package.json":
         return "package_json"
     if lowered in {"pyproject.toml", "project.toml"}:
         return "pyproject"
-    if name == "Cargo.toml":
-        return "cargo"
     if lowered == "cargo.toml":
         return "cargo"
-    raise click.ClickException(
-        "Unsupported version file "
-        f"{path}. Supported filenames: {', '.join(SUPPORTED_AUTO_VERSION_FILES)}."
-    )
+    return None
+
+
+def _version_file_kind(path: Path) -> _VersionFileKind:
+    kind = _version_file_kind_for_name(path.name)
+    if kind is None:
+        raise click.ClickException(
+            "Unsupported version file "
+            f"{path}. Supported filenames: {', '.join(SUPPORTED_AUTO_VERSION_FILES)}."
+        )
+    return kind
 
 
 def _sibling_uv_lockfile(path: Path) -> Path | None:
@@ -488,18 +619,20 @@ def _plan_single_version_file_update(
             skip_if_missing_static_version=not strict,
         )
 
+    # Updaters hand back the original string when the version already
+    # matches, so the no-op comparison short-circuits on identity.
     if updated_content == content:
         return None
+    # Only rescan for a static [project] version when a uv.lock is present.
+    uv_lockfile = _sibling_uv_lockfile(path) if kind == "pyproject" else None
+    if uv_lockfile is not None and not _has_static_project_version(content, new_version):
+        uv_lockfile = None
     return VersionFileUpdate(
         path=path,
         old_version=old_version,
         new_version=new_version,
         content=updated_content,
-        uv_lockfile=(
-            _sibling_uv_lockfile(path)
-            if kind == "pyproject" and _has_static_project_version(content, new_version)
-            else None
-        ),
+        uv_lockfile=uv_lockfile,
     )
 
 
@@ -663,6 +796,8 @@ def apply_version_file_updates(updates: Sequence[VersionFileUpdate]) -> list[Pat
     snapshots = _snapshot_files(updated_paths)
     try:
         for update in updates:
+            if snapshots.get(update.path) == update.content.encode("utf-8"):
+                continue
             update.path.write_text(update.content, encoding="utf-8")
 
         for uv_lockfile in uv_lockfiles:
@@ -0,0 +1,126 @@
+"""Shared fixtures for the tenzir-ship test suite."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner, Result
+
+from tenzir_ship import Changelog
+from tenzir_ship.cli import cli
+
+# Intro text passed to `release create` via --intro-file.
+_INTRO_BYTES = b"Welcome to the release!\n\n![Image](assets/hero.png)\n"
+
+# Entries added to the shared projects, as `Changelog.add` keyword arguments.
+_SHARED_ENTRIES: tuple[dict[str, Any], ...] = (
+    {
+        "title": "Exciting Feature",
+        "entry_type": "feature",
+        "description": "Adds an exciting capability.",
+        "authors": ["octocat"],
+        "prs": ["42"],
+    },
+    {
+        "title": "Remove legacy API",
+        "entry_type": "breaking",
+        "description": "Removes the deprecated ingest API to prepare for v1.",
+        "authors": ["codex"],
+    },
+    {
+        "title": "Fix ingest crash",
+        "entry_type": "bugfix",
+        "description": "Resolves ingest worker crash when tokens expire.",
+        "authors": ["bob"],
+        "prs": ["102", "115"],
+    },
+)
+
+
+class _PropagatingRunner(CliRunner):
+    """CliRunner that lets unexpected exceptions propagate to the test.
+
+    Click exceptions and exits are still turned into exit codes by the
+    command's standalone mode.
+    """
+
+    def invoke(self, cli: Any, args: Any = None, **kwargs: Any) -> Result:
+        kwargs.setdefault("catch_exceptions", False)
+        return super().invoke(cli, args, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Return a Click test runner shared by the whole session."""
+    return _PropagatingRunner()
+
+
+@pytest.fixture(scope="session")
+def session_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a fixed-name directory for session-scoped test data."""
+    return tmp_path_factory.mktemp("ship-tests", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def intro_file(session_tmp: Path) -> Path:
+    """Return a release intro file written once per session."""
+    path = session_tmp / "intro.md"
+    path.write_bytes(_INTRO_BYTES)
+    return path
+
+
+@pytest.fixture(scope="session")
+def unreleased_template(session_tmp: Path) -> Path:
+    """Return a project holding the three shared entries as unreleased.
+
+    The template is built once per session through one ``Changelog``, so the
+    project config is loaded a single time. Tests must not modify it; use
+    ``unreleased_project`` for a writable copy.
+    """
+    project_dir = session_tmp / "template" / "project"
+    project_dir.mkdir(parents=True)
+    changelog = Changelog(root=project_dir)
+    for entry in _SHARED_ENTRIES:
+        changelog.add(**entry)
+    return project_dir
+
+
+@pytest.fixture
+def unreleased_project(unreleased_template: Path, tmp_path: Path) -> Path:
+    """Return a writable copy of the unreleased template project."""
+    project_dir = tmp_path / "project"
+    shutil.copytree(unreleased_template, project_dir)
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def built_project(
+    session_tmp: Path, unreleased_template: Path, runner: CliRunner, intro_file: Path
+) -> Path:
+    """Return a project whose three entries were released as v1.0.0.
+
+    The project is built once per session and shared between tests, so tests
+    using it must treat it as read-only.
+    """
+    project_dir = session_tmp / "project"
+    shutil.copytree(unreleased_template, project_dir)
+
+    result = runner.invoke(
+        cli,
+        [
+            "--root",
+            str(project_dir),
+            "release",
+            "create",
+            "v1.0.0",
+            "--intro-file",
+            str(intro_file),
+            "--compact",
+            "--yes",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    return project_dir
@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import os
+import re
 import subprocess
 from datetime import date, datetime
 from pathlib import Path
+from typing import Any
 
 import click
 import pytest
 import yaml
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 from rich.panel import Panel
 
 import tenzir_ship.cli._release as release_module
-from tenzir_ship import __version__
+from tenzir_ship import Changelog, __version__
 from tenzir_ship.cli import INFO_PREFIX, cli, main
 from tenzir_ship.cli._core import create_cli_context
 from tenzir_ship.cli._show import _collect_unused_entries_for_release
 from tenzir_ship.config import Config, ReleaseConfig, load_config, save_config
-from tenzir_ship.entries import ENTRY_DIRECTORY_ANCHOR, read_entry, write_entry
+from tenzir_ship.entries import ENTRY_DIRECTORY_ANCHOR, list_entry_files, read_entry, write_entry
+from tenzir_ship.releases import load_release_manifest_data
+from tenzir_ship.utils import load_yaml
 from tenzir_ship.validate import validate_entry
+from tenzir_ship.version_files import resolve_version_file_targets
 
 
 def test_cli_version_option(capsys: pytest.CaptureFixture[str]) -> None:
@@ -31,159 +38,160 @@ def test_cli_version_option(capsys: pytest.CaptureFixture[str]) -> None:
     assert captured.out.strip() == __version__
 
 
-def test_add_initializes_and_release(tmp_path: Path) -> None:
-    runner = CliRunner()
+# Exact notes.md written for the shared entries released with --compact.
+_EXPECTED_V1_NOTES = """\
+Welcome to the release!
+
+![Image](assets/hero.png)
+
+## 💥 Breaking changes
+
+- Removes the deprecated ingest API to prepare for v1. (by @codex)
+
+## 🚀 Features
+
+- Adds an exciting capability. (by @octocat in #42)
+
+## 🐞 Bug fixes
+
+- Resolves ingest worker crash when tokens expire. (by @bob in #102 and #115)
+"""
+# Log lines carry raw ANSI prefixes regardless of Click's color setting.
+_PLAIN_INFO_PREFIX = click.utils.strip_ansi(INFO_PREFIX)
+_SECTION_HEADING_PATTERN = re.compile(r"^## [^\n]+", re.MULTILINE)
+
+
+def _section_headings(text: str) -> list[str]:
+    """Return the level-two Markdown headings of a document in order."""
+    return _SECTION_HEADING_PATTERN.findall(text)
+
+
+def _missing_snippets(path: Path, *snippets: bytes) -> list[bytes]:
+    """Return the snippets absent from a file, reading it a single time."""
+    data = path.read_bytes()
+    return [snippet for snippet in snippets if snippet not in data]
+
+
+def _capture_show(changelog: Changelog, **options: Any) -> str:
+    """Run ``Changelog.show`` in-process and return everything it printed."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        changelog.show(**options)
+    return buffer.getvalue()
+
+
+def _invoke(runner: CliRunner, project_dir: Path, *args: str) -> Result:
+    """Invoke the CLI in-process against the given changelog root."""
+    return runner.invoke(cli, ["--root", str(project_dir), *args])
+
+
+def test_add_initializes_project(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     config_path = project_dir / "config.yaml"
     assert not config_path.exists()
 
-    # Add entries via CLI, relying on defaults for type/project.
-    add_result = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "add",
-            "--title",
-            "Exciting Feature",
-            "--type",
-            "feature",
-            "--description",
-            "Adds an exciting capability.",
-            "--author",
-            "octocat",
-            "--pr",
-            "42",
-        ],
+    # Add the first entry via CLI, relying on defaults for type/project.
+    add_result = _invoke(
+        runner,
+        project_dir,
+        "add",
+        "--title",
+        "Exciting Feature",
+        "--type",
+        "feature",
+        "--description",
+        "Adds an exciting capability.",
+        "--author",
+        "octocat",
+        "--pr",
+        "42",
     )
     assert add_result.exit_code == 0, add_result.output
     assert config_path.exists()
 
-    add_breaking = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "add",
-            "--title",
-            "Remove legacy API",
-            "--type",
-            "breaking",
-            "--description",
-            "Removes the deprecated ingest API to prepare for v1.",
-            "--author",
-            "codex",
-        ],
+    # The remaining entries go through the Python API, which loads the config once.
+    changelog = Changelog(root=project_dir)
+    changelog.add(
+        title="Remove legacy API",
+        entry_type="breaking",
+        description="Removes the deprecated ingest API to prepare for v1.",
+        authors=["codex"],
     )
-    assert add_breaking.exit_code == 0, add_breaking.output
-
-    add_bugfix = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "add",
-            "--title",
-            "Fix ingest crash",
-            "--type",
-            "bugfix",
-            "--description",
-            "Resolves ingest worker crash when tokens expire.",
-            "--author",
-            "bob",
-            "--pr",
-            "102",
-            "--pr",
-            "115",
-        ],
+    changelog.add(
+        title="Fix ingest crash",
+        entry_type="bugfix",
+        description="Resolves ingest worker crash when tokens expire.",
+        authors=["bob"],
+        prs=["102", "115"],
     )
-    assert add_bugfix.exit_code == 0, add_bugfix.output
 
     entries_dir = project_dir / "unreleased"
-    entry_files = sorted(entries_dir.glob("*.md"))
+    entry_files = {path.stem: path for path in list_entry_files(entries_dir)}
     assert len(entry_files) == 3
 
-    feature_entry_matches = list(entries_dir.glob("exciting-feature.md"))
-    assert feature_entry_matches
-    feature_entry = feature_entry_matches[0]
+    feature_entry = entry_files["exciting-feature"]
     assert feature_entry.stem == "exciting-feature"
-    entry_text = feature_entry.read_text(encoding="utf-8")
-    assert "created:" in entry_text
-    assert "prs:" in entry_text
-    assert "  - 42" in entry_text
-    assert "project:" not in entry_text
+    assert _missing_snippets(feature_entry, b"created:", b"prs:", b"  - 42") == []
+    assert b"project:" not in feature_entry.read_bytes()
     parsed_entry = read_entry(feature_entry)
     assert isinstance(parsed_entry.metadata["created"], datetime)
     assert parsed_entry.created_at == parsed_entry.metadata["created"]
 
-    breaking_entry_matches = list(entries_dir.glob("remove-legacy-api.md"))
-    assert breaking_entry_matches
-    breaking_entry = breaking_entry_matches[0]
-    breaking_text = breaking_entry.read_text(encoding="utf-8")
-    assert "type: breaking" in breaking_text
-    assert "Removes the deprecated ingest API to prepare for v1." in breaking_text
+    breaking_entry = entry_files["remove-legacy-api"]
+    assert (
+        _missing_snippets(
+            breaking_entry,
+            b"type: breaking",
+            b"Removes the deprecated ingest API to prepare for v1.",
+        )
+        == []
+    )
+
+    bugfix_entry = entry_files["fix-ingest-crash"]
+    assert _missing_snippets(bugfix_entry, b"prs:", b"- 102", b"- 115") == []
+    assert b"project:" not in bugfix_entry.read_bytes()
 
-    bugfix_entry_matches = list(entries_dir.glob("fix-ingest-crash.md"))
-    assert bugfix_entry_matches
-    bugfix_entry = bugfix_entry_matches[0]
-    bugfix_text = bugfix_entry.read_text(encoding="utf-8")
-    assert "prs:" in bugfix_text
-    assert "- 102" in bugfix_text and "- 115" in bugfix_text
-    assert "project:" not in bugfix_text
 
-    feature_entry_id = feature_entry.stem
-    bugfix_entry_id = bugfix_entry.stem
+def test_release_create_from_unreleased_entries(
+    unreleased_project: Path, runner: CliRunner, intro_file: Path
+) -> None:
+    project_dir = unreleased_project
+    entries_dir = project_dir / "unreleased"
+    feature_entry_id = "exciting-feature"
 
-    get_feature = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-c",
-            feature_entry_id,
-        ],
+    feature_card = _capture_show(
+        Changelog(root=project_dir), identifiers=[feature_entry_id], view="card"
     )
-    assert get_feature.exit_code == 0, get_feature.output
-    feature_plain = click.utils.strip_ansi(get_feature.output)
+    feature_plain = click.utils.strip_ansi(feature_card)
     assert "Exciting Feature" in feature_plain
     assert feature_entry_id in feature_plain
 
-    intro_file = tmp_path / "intro.md"
-    intro_file.write_text("Welcome to the release!\n\n![Image](assets/hero.png)\n")
-
-    release_preview = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "release",
-            "create",
-            "v1.0.0",
-            "--intro-file",
-            str(intro_file),
-            "--compact",
-        ],
+    release_preview = _invoke(
+        runner,
+        project_dir,
+        "release",
+        "create",
+        "v1.0.0",
+        "--intro-file",
+        str(intro_file),
+        "--compact",
     )
     assert release_preview.exit_code == 1
     assert "re-run with --yes to apply these updates." in click.utils.strip_ansi(
         release_preview.output
     )
 
-    release_result = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "release",
-            "create",
-            "v1.0.0",
-            "--intro-file",
-            str(intro_file),
-            "--compact",
-            "--yes",
-        ],
+    release_result = _invoke(
+        runner,
+        project_dir,
+        "release",
+        "create",
+        "v1.0.0",
+        "--intro-file",
+        str(intro_file),
+        "--compact",
+        "--yes",
     )
     assert release_result.exit_code == 0, release_result.output
     release_dir = project_dir / "releases" / "v1.0.0"
@@ -192,25 +200,9 @@ def test_add_initializes_and_release(tmp_path: Path) -> None:
     assert release_path.exists()
     assert manifest_path.exists()
 
-    release_text = release_path.read_text(encoding="utf-8")
-    assert "Welcome to the release!" in release_text
-    assert "## 💥 Breaking changes" in release_text
-    assert "- Removes the deprecated ingest API to prepare for v1. (by @codex)" in release_text
-    assert "- Adds an exciting capability. (by @octocat in #42)" in release_text
-    assert (
-        "- Resolves ingest worker crash when tokens expire. (by @bob in #102 and #115)"
-        in release_text
-    )
-    assert "## 🚀 Features" in release_text
-    assert "## 🐞 Bug fixes" in release_text
-    assert (
-        release_text.index("## 💥 Breaking changes")
-        < release_text.index("## 🚀 Features")
-        < release_text.index("## 🐞 Bug fixes")
-    )
-    assert "![Image](assets/hero.png)" in release_text
+    assert release_path.read_bytes() == _EXPECTED_V1_NOTES.encode("utf-8")
 
-    manifest_data = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(manifest_path)
     assert "version" not in manifest_data
     assert isinstance(manifest_data["created"], date)
     assert "description" not in manifest_data
@@ -220,33 +212,20 @@ def test_add_initializes_and_release(tmp_path: Path) -> None:
 
     release_entries_dir = release_dir / "entries"
     assert release_entries_dir.is_dir()
-    assert list(release_entries_dir.glob("exciting-feature.md"))
-    assert list(release_entries_dir.glob("remove-legacy-api.md"))
-    assert list(release_entries_dir.glob("fix-ingest-crash.md"))
-    release_entry_stems = {path.stem for path in release_entries_dir.glob("*.md")}
+    release_entry_stems = {path.stem for path in list_entry_files(release_entries_dir)}
     assert "exciting-feature" in release_entry_stems
     assert "remove-legacy-api" in release_entry_stems
     assert "fix-ingest-crash" in release_entry_stems
-    assert not any(entries_dir.glob("*.md"))
+    assert not list_entry_files(entries_dir)
     assert (entries_dir / ENTRY_DIRECTORY_ANCHOR).exists()
 
-    idempotent_result = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "release",
-            "create",
-            "v1.0.0",
-        ],
-    )
+    idempotent_result = _invoke(runner, project_dir, "release", "create", "v1.0.0")
     assert idempotent_result.exit_code == 0, idempotent_result.output
     assert "already up to date" in idempotent_result.output
 
-    list_result = runner.invoke(
-        cli,
-        ["--root", str(project_dir), "show"],
-    )
+
+def test_show_lists_released_project(built_project: Path, runner: CliRunner) -> None:
+    list_result = _invoke(runner, built_project, "show")
     assert list_result.exit_code == 0, list_result.output
     plain_list = click.utils.strip_ansi(list_result.output)
     assert "Name:" not in plain_list
@@ -254,19 +233,13 @@ def test_add_initializes_and_release(tmp_path: Path) -> None:
     assert "exciting-feature" in plain_list or "Exciting Feature" in plain_list
     assert "1.0.0" in plain_list
 
-    list_banner = runner.invoke(
-        cli,
-        ["--root", str(project_dir), "show", "--banner"],
-    )
+    list_banner = _invoke(runner, built_project, "show", "--banner")
     assert list_banner.exit_code == 0, list_banner.output
     banner_output = click.utils.strip_ansi(list_banner.output)
     assert "Name: " in banner_output
     assert "Types: " in banner_output
 
-    release_list = runner.invoke(
-        cli,
-        ["--root", str(project_dir), "show", "v1.0.0"],
-    )
+    release_list = _invoke(runner, built_project, "show", "v1.0.0")
     assert release_list.exit_code == 0, release_list.output
     release_plain = click.utils.strip_ansi(release_list.output)
     assert "Included Entries" in release_plain
@@ -274,134 +247,115 @@ def test_add_initializes_and_release(tmp_path: Path) -> None:
     assert "remove-legacy-api" in release_plain
     assert "fix-ingest-crash" in release_plain
 
-    get_md = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-m",
-            "v1.0.0",
-        ],
-    )
-    assert get_md.exit_code == 0, get_md.output
-    assert "First stable release." not in get_md.output
-    assert "## 💥 Breaking changes" in get_md.output
-    assert "## 🚀 Features" in get_md.output
-    assert "### Remove legacy API" in get_md.output
-    assert "By @codex" in get_md.output
-    assert "### Exciting Feature" in get_md.output
-    assert "By @octocat" in get_md.output
-    assert "in #42" in get_md.output
-    assert "### Fix ingest crash" in get_md.output
-    assert "#102" in get_md.output and "#115" in get_md.output
-    assert get_md.output.index("## 💥 Breaking changes") < get_md.output.index("## 🚀 Features")
-    assert get_md.output.index("## 🚀 Features") < get_md.output.index("## 🐞 Bug fixes")
 
-    get_md_plain = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-m",
-            "--no-emoji",
-            "v1.0.0",
-        ],
-    )
-    assert get_md_plain.exit_code == 0, get_md_plain.output
-    assert "First stable release." not in get_md_plain.output
-    assert "## Breaking changes" in get_md_plain.output
-    assert "## Features" in get_md_plain.output
-    assert "### Remove legacy API" in get_md_plain.output
-    assert "### Exciting Feature" in get_md_plain.output
-    assert "### Fix ingest crash" in get_md_plain.output
-    assert "## Bug fixes" in get_md_plain.output
-    assert get_md_plain.output.index("## Breaking changes") < get_md_plain.output.index(
-        "## Features"
-    )
-    assert get_md_plain.output.index("## Features") < get_md_plain.output.index("## Bug fixes")
-    assert "💥" not in get_md_plain.output
-    assert "🚀" not in get_md_plain.output
-    assert "🐞" not in get_md_plain.output
+_EMOJI_RELEASE_HEADINGS = ("## 💥 Breaking changes", "## 🚀 Features", "## 🐞 Bug fixes")
+_PLAIN_RELEASE_HEADINGS = ("## Breaking changes", "## Features", "## Bug fixes")
+_RELEASE_EMOJIS = ("💥", "🚀", "🐞")
+_DETAILED_RELEASE_SNIPPETS = (
+    "### Remove legacy API",
+    "### Exciting Feature",
+    "### Fix ingest crash",
+)
+_COMPACT_RELEASE_SNIPPETS = (
+    "- Removes the deprecated ingest API to prepare for v1. (by @codex)",
+    "- Adds an exciting capability. (by @octocat in #42)",
+    "- Resolves ingest worker crash when tokens expire. (by @bob in #102 and #115)",
+)
+_RELEASE_MARKDOWN_VARIANTS: dict[str, dict[str, Any]] = {
+    "markdown": {},
+    "markdown-no-emoji": {"include_emoji": False},
+    "compact": {"compact": True},
+    "compact-no-emoji": {"compact": True, "include_emoji": False},
+}
+
+
+@pytest.fixture(scope="module")
+def release_markdown(built_project: Path) -> dict[str, str]:
+    """Render v1.0.0 of the shared project once per markdown variant."""
+    changelog = Changelog(root=built_project)
+    return {
+        variant: _capture_show(changelog, identifiers=["v1.0.0"], view="markdown", **options)
+        for variant, options in _RELEASE_MARKDOWN_VARIANTS.items()
+    }
 
-    get_compact = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-m",
-            "--compact",
-            "v1.0.0",
-        ],
-    )
-    assert get_compact.exit_code == 0, get_compact.output
-    assert "First stable release." not in get_compact.output
-    assert "## 💥 Breaking changes" in get_compact.output
-    assert "## 🚀 Features" in get_compact.output
-    assert (
-        "- Removes the deprecated ingest API to prepare for v1. (by @codex)" in get_compact.output
-    )
-    assert "- Adds an exciting capability. (by @octocat in #42)" in get_compact.output
-    assert "## 🐞 Bug fixes" in get_compact.output
-    assert (
-        "- Resolves ingest worker crash when tokens expire. (by @bob in #102 and #115)"
-        in get_compact.output
-    )
-    assert get_compact.output.index("## 💥 Breaking changes") < get_compact.output.index(
-        "## 🚀 Features"
-    )
-    assert get_compact.output.index("## 🚀 Features") < get_compact.output.index("## 🐞 Bug fixes")
-    get_compact_plain = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-m",
-            "--no-emoji",
-            "--compact",
-            "v1.0.0",
-        ],
-    )
-    assert get_compact_plain.exit_code == 0, get_compact_plain.output
-    assert "First stable release." not in get_compact_plain.output
-    assert "## Breaking changes" in get_compact_plain.output
-    assert "## Features" in get_compact_plain.output
-    assert (
-        "- Removes the deprecated ingest API to prepare for v1. (by @codex)"
-        in get_compact_plain.output
-    )
-    assert "- Adds an exciting capability. (by @octocat in #42)" in get_compact_plain.output
-    assert (
-        "- Resolves ingest worker crash when tokens expire. (by @bob in #102 and #115)"
-        in get_compact_plain.output
-    )
-    assert "## Bug fixes" in get_compact_plain.output
-    assert get_compact_plain.output.index("## Breaking changes") < get_compact_plain.output.index(
-        "## Features"
-    )
-    assert get_compact_plain.output.index("## Features") < get_compact_plain.output.index(
-        "## Bug fixes"
-    )
-    assert "💥" not in get_compact_plain.output
-    assert "🚀" not in get_compact_plain.output
-    assert "🐞" not in get_compact_plain.output
 
-    get_json = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-j",
-            "--compact",
-            "v1.0.0",
-        ],
-    )
+@pytest.mark.parametrize(
+    ("variant", "expected", "forbidden", "sections"),
+    [
+        pytest.param(
+            "markdown",
+            (
+                *_DETAILED_RELEASE_SNIPPETS,
+                "By @codex",
+                "By @octocat",
+                "in #42",
+                "#102",
+                "#115",
+            ),
+            ("First stable release.",),
+            _EMOJI_RELEASE_HEADINGS,
+            id="markdown",
+        ),
+        pytest.param(
+            "markdown-no-emoji",
+            _DETAILED_RELEASE_SNIPPETS,
+            ("First stable release.", *_RELEASE_EMOJIS),
+            _PLAIN_RELEASE_HEADINGS,
+            id="markdown-no-emoji",
+        ),
+        pytest.param(
+            "compact",
+            _COMPACT_RELEASE_SNIPPETS,
+            ("First stable release.",),
+            _EMOJI_RELEASE_HEADINGS,
+            id="compact",
+        ),
+        pytest.param(
+            "compact-no-emoji",
+            _COMPACT_RELEASE_SNIPPETS,
+            ("First stable release.", *_RELEASE_EMOJIS),
+            _PLAIN_RELEASE_HEADINGS,
+            id="compact-no-emoji",
+        ),
+    ],
+)
+def test_show_release_markdown_variants(
+    release_markdown: dict[str, str],
+    variant: str,
+    expected: tuple[str, ...],
+    forbidden: tuple[str, ...],
+    sections: tuple[str, ...],
+) -> None:
+    output = release_markdown[variant]
+    for snippet in expected:
+        assert snippet in output, f"missing {snippet!r}"
+    for snippet in forbidden:
+        assert snippet not in output, f"unexpected {snippet!r}"
+    assert _section_headings(output) == list(sections)
+
+
+@pytest.mark.parametrize("layout", ["markdown", "compact"])
+def test_show_release_no_emoji_only_drops_emoji(
+    release_markdown: dict[str, str], layout: str
+) -> None:
+    with_emoji = release_markdown[layout]
+    for emoji in _RELEASE_EMOJIS:
+        with_emoji = with_emoji.replace(f"{emoji} ", "")
+    assert with_emoji == release_markdown[f"{layout}-no-emoji"]
+
+
+def test_show_release_markdown_cli_matches_api(
+    built_project: Path, runner: CliRunner, release_markdown: dict[str, str]
+) -> None:
+    result = _invoke(runner, built_project, "show", "-m", "--no-emoji", "--compact", "v1.0.0")
+    assert result.exit_code == 0, result.output
+    assert result.output == release_markdown["compact-no-emoji"]
+
+
+def test_show_release_json(built_project: Path, runner: CliRunner) -> None:
+    get_json = _invoke(runner, built_project, "show", "-j", "--compact", "v1.0.0")
     assert get_json.exit_code == 0, get_json.output
-    payload = json.loads(get_json.output)
+    payload = json.loads(get_json.stdout_bytes)
     assert payload["version"] == "v1.0.0"
     assert payload["project"] == "project"
     assert len(payload["entries"]) == 3
@@ -410,34 +364,47 @@ def test_add_initializes_and_release(tmp_path: Path) -> None:
     assert breaking_entry["type"] == "breaking"
     assert breaking_entry["authors"] == [{"handle": "codex", "url": "https://github.com/codex"}]
     assert breaking_entry.get("excerpt") == "Removes the deprecated ingest API to prepare for v1."
-    feature_entry = next(
-        entry for entry in payload["entries"] if entry["title"] == "Exciting Feature"
-    )
+    by_title = {entry["title"]: entry for entry in payload["entries"]}
+    feature_entry = by_title["Exciting Feature"]
     assert feature_entry["prs"] == [{"number": 42}]
     assert "pr" not in feature_entry
     assert feature_entry["project"] == "project"
     assert feature_entry.get("excerpt") == "Adds an exciting capability."
 
-    bugfix_entry = next(
-        entry for entry in payload["entries"] if entry["title"] == "Fix ingest crash"
-    )
+    bugfix_entry = by_title["Fix ingest crash"]
     assert bugfix_entry["prs"] == [{"number": 102}, {"number": 115}]
     assert bugfix_entry["project"] == "project"
     assert bugfix_entry.get("excerpt") == "Resolves ingest worker crash when tokens expire."
     assert payload.get("compact") is True
 
-    single_entry_json = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-j",
-            feature_entry_id,
-        ],
+    json_plain = _capture_show(
+        Changelog(root=built_project),
+        identifiers=["v1.0.0"],
+        view="json",
+        compact=True,
+        include_emoji=False,
     )
+    payload_plain = json.loads(json_plain)
+    assert payload_plain["entries"][0]["title"] == "Remove legacy API"
+    assert payload_plain["entries"][0]["type"] == "breaking"
+    plain_by_title = {entry["title"]: entry for entry in payload_plain["entries"]}
+    plain_feature = plain_by_title["Exciting Feature"]
+    assert plain_feature["prs"] == [{"number": 42}]
+    assert all("🚀" not in title for title in plain_by_title)
+    assert all("💥" not in title for title in plain_by_title)
+
+
+def test_show_selected_entries(built_project: Path, runner: CliRunner) -> None:
+    feature_entry_id = "exciting-feature"
+    bugfix_entry_id = "fix-ingest-crash"
+    parsed_entry = read_entry(
+        built_project / "releases" / "v1.0.0" / "entries" / "exciting-feature.md"
+    )
+    assert parsed_entry.created_at is not None
+
+    single_entry_json = _invoke(runner, built_project, "show", "-j", feature_entry_id)
     assert single_entry_json.exit_code == 0, single_entry_json.output
-    single_payload = json.loads(single_entry_json.output)
+    single_payload = json.loads(single_entry_json.stdout_bytes)
     assert single_payload["title"] == f"Entry {feature_entry_id}"
     assert single_payload["project"] == "project"
     assert single_payload["entries"][0]["id"] == feature_entry_id
@@ -445,80 +412,34 @@ def test_add_initializes_and_release(tmp_path: Path) -> None:
     assert single_payload["entries"][0]["title"] == "Exciting Feature"
     assert single_payload["created"] == parsed_entry.created_at.isoformat()
 
-    multi_entry_json = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-j",
-            feature_entry_id,
-            bugfix_entry_id,
-        ],
+    changelog = Changelog(root=built_project)
+    multi_entry_json = _capture_show(
+        changelog, identifiers=[feature_entry_id, bugfix_entry_id], view="json"
     )
-    assert multi_entry_json.exit_code == 0, multi_entry_json.output
-    multi_payload = json.loads(multi_entry_json.output)
+    multi_payload = json.loads(multi_entry_json)
     assert multi_payload["title"] == "Selected Entries"
-    exported_titles = {entry["title"] for entry in multi_payload["entries"]}
-    assert exported_titles == {"Exciting Feature", "Fix ingest crash"}
+    multi_by_title = {entry["title"]: entry for entry in multi_payload["entries"]}
+    assert multi_by_title.keys() == {"Exciting Feature", "Fix ingest crash"}
+    assert multi_by_title["Exciting Feature"]["id"] == feature_entry_id
+    assert multi_by_title["Fix ingest crash"]["id"] == bugfix_entry_id
 
-    multi_entry_markdown = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-m",
-            feature_entry_id,
-            bugfix_entry_id,
-        ],
-    )
-    assert multi_entry_markdown.exit_code == 0, multi_entry_markdown.output
-    get_json_plain = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-j",
-            "--no-emoji",
-            "--compact",
-            "v1.0.0",
-        ],
+    multi_entry_markdown = _capture_show(
+        changelog, identifiers=[feature_entry_id, bugfix_entry_id], view="markdown"
     )
-    assert get_json_plain.exit_code == 0, get_json_plain.output
-    payload_plain = json.loads(get_json_plain.output)
-    assert payload_plain["entries"][0]["title"] == "Remove legacy API"
-    assert payload_plain["entries"][0]["type"] == "breaking"
-    plain_feature = next(
-        entry for entry in payload_plain["entries"] if entry["title"] == "Exciting Feature"
-    )
-    assert plain_feature["prs"] == [{"number": 42}]
-    assert all("🚀" not in entry["title"] for entry in payload_plain["entries"])
-    assert all("💥" not in entry["title"] for entry in payload_plain["entries"])
+    assert "Exciting Feature" in multi_entry_markdown
+    assert "Fix ingest crash" in multi_entry_markdown
 
-    get_missing_entry = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "show",
-            "-c",
-            "nonexistent-entry",
-        ],
-    )
+    get_missing_entry = _invoke(runner, built_project, "show", "-c", "nonexistent-entry")
     assert get_missing_entry.exit_code != 0, get_missing_entry.output
     assert "No entry found matching" in get_missing_entry.output
 
-    validate_result = runner.invoke(
-        cli,
-        ["--root", str(project_dir), "validate"],
-    )
+
+def test_validate_accepts_released_project(built_project: Path, runner: CliRunner) -> None:
+    validate_result = _invoke(runner, built_project, "validate")
     assert validate_result.exit_code == 0, validate_result.output
 
 
-def test_add_infers_metadata_from_gh_context(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_add_infers_metadata_from_gh_context(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -571,7 +492,7 @@ def test_add_infers_metadata_from_gh_context(tmp_path: Path) -> None:
     assert add_result.exit_code == 0, add_result.output
 
     entries_dir = project_dir / "unreleased"
-    entry_files = list(entries_dir.glob("*.md"))
+    entry_files = list_entry_files(entries_dir)
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     assert entry.metadata["authors"] == ["codex"]
@@ -648,7 +569,7 @@ created: 2026-01-01T00:00:00Z
 
 def _set_repository(project_dir: Path, repository: str = "tenzir/example") -> None:
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = repository
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -659,7 +580,7 @@ def _captured_title(command: list[str]) -> str | None:
 
 def _rewrite_release_manifest_title(project_dir: Path, tag: str, title: str) -> None:
     manifest_path = project_dir / "releases" / tag / "manifest.yaml"
-    manifest = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+    manifest = load_release_manifest_data(manifest_path)
     manifest["title"] = title
     manifest_path.write_text(yaml.safe_dump(manifest, sort_keys=False), encoding="utf-8")
 
@@ -687,8 +608,9 @@ def _setup_publishable_release(
     _set_repository(project_dir)
 
 
-def test_release_create_anchors_unreleased_directory_for_git_merges(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_anchors_unreleased_directory_for_git_merges(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     repo = tmp_path / "repo"
     project_dir = repo / "changelog"
     project_dir.mkdir(parents=True)
@@ -714,7 +636,7 @@ def test_release_create_anchors_unreleased_directory_for_git_merges(tmp_path: Pa
         ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"],
     )
     assert release_result.exit_code == 0, release_result.output
-    assert not any((project_dir / "unreleased").glob("*.md"))
+    assert not list_entry_files(project_dir / "unreleased")
     assert (project_dir / "unreleased" / ENTRY_DIRECTORY_ANCHOR).exists()
     _run_git(repo, "add", ".")
     _run_git(repo, "commit", "-m", "Release", "--no-gpg-sign")
@@ -729,8 +651,8 @@ def test_release_create_anchors_unreleased_directory_for_git_merges(tmp_path: Pa
 
 def test_release_create_restores_missing_unreleased_anchor_for_up_to_date_release(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     _write_legacy_entry(project_dir, "released-entry", "Released Entry")
@@ -753,15 +675,13 @@ def test_release_create_restores_missing_unreleased_anchor_for_up_to_date_releas
     assert "already up to date" not in rerun_result.output
 
 
-def test_missing_project_reports_info_message(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_missing_project_reports_info_message(tmp_path: Path, runner: CliRunner) -> None:
     result = runner.invoke(cli, ["--root", str(tmp_path), "show"])
     assert result.exit_code == 1
     expected_root = tmp_path.resolve()
-    plain_prefix = click.utils.strip_ansi(INFO_PREFIX)
     expected_plain_output = (
-        f"{plain_prefix}no tenzir-ship project detected at {expected_root}.\n"
-        f"{plain_prefix}run 'tenzir-ship add' from your project root or provide --root.\n"
+        f"{_PLAIN_INFO_PREFIX}no tenzir-ship project detected at {expected_root}.\n"
+        f"{_PLAIN_INFO_PREFIX}run 'tenzir-ship add' from your project root or provide --root.\n"
     )
     assert click.utils.strip_ansi(result.output) == expected_plain_output
     assert "Error:" not in result.output
@@ -792,8 +712,7 @@ def test_implicit_resolution_prefers_changelog_subdirectory(tmp_path: Path) -> N
     assert ctx.config_path == (changelog_root / "config.yaml").resolve()
 
 
-def test_implicit_resolution_ignores_legacy_root_layout(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_implicit_resolution_ignores_legacy_root_layout(tmp_path: Path, runner: CliRunner) -> None:
     workspace = tmp_path / "workspace"
     workspace.mkdir()
     save_config(Config(id="legacy-root", name="Legacy Root"), workspace / "config.yaml")
@@ -808,10 +727,9 @@ def test_implicit_resolution_ignores_legacy_root_layout(tmp_path: Path) -> None:
 
     assert result.exit_code == 1
     expected_root = (workspace / "changelog").resolve()
-    plain_prefix = click.utils.strip_ansi(INFO_PREFIX)
     expected_plain_output = (
-        f"{plain_prefix}no tenzir-ship project detected at {expected_root}.\n"
-        f"{plain_prefix}run 'tenzir-ship add' from your project root or provide --root.\n"
+        f"{_PLAIN_INFO_PREFIX}no tenzir-ship project detected at {expected_root}.\n"
+        f"{_PLAIN_INFO_PREFIX}run 'tenzir-ship add' from your project root or provide --root.\n"
     )
     assert click.utils.strip_ansi(result.output) == expected_plain_output
     assert "Error:" not in result.output
@@ -847,8 +765,7 @@ def _write_package_metadata(path: Path, *, package_id: str = "pkg", name: str =
     )
 
 
-def test_package_mode_uses_package_metadata(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_package_mode_uses_package_metadata(tmp_path: Path, runner: CliRunner) -> None:
     package_dir = tmp_path / "demo"
     changelog_root = package_dir / "changelog"
     changelog_root.mkdir(parents=True)
@@ -858,8 +775,7 @@ def test_package_mode_uses_package_metadata(tmp_path: Path) -> None:
     assert result.exit_code == 0, result.output
 
 
-def test_package_mode_requires_id_and_name(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_package_mode_requires_id_and_name(tmp_path: Path, runner: CliRunner) -> None:
     package_dir = tmp_path / "broken"
     changelog_root = package_dir / "changelog"
     changelog_root.mkdir(parents=True)
@@ -870,8 +786,9 @@ def test_package_mode_requires_id_and_name(tmp_path: Path) -> None:
     assert "missing required 'name'" in result.output
 
 
-def test_package_mode_detects_root_from_package_directories(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_package_mode_detects_root_from_package_directories(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     package_dir = tmp_path / "workspace"
     changelog_root = package_dir / "changelog"
     changelog_root.mkdir(parents=True)
@@ -893,8 +810,9 @@ def test_package_mode_detects_root_from_package_directories(tmp_path: Path) -> N
     assert changelog_invocation.exit_code == 0, changelog_invocation.output
 
 
-def test_package_mode_bootstraps_changelog_from_package_root(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_package_mode_bootstraps_changelog_from_package_root(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     package_dir = tmp_path / "workspace"
     package_dir.mkdir()
     _write_package_metadata(package_dir / "package.yaml", package_id="workspace", name="Workspace")
@@ -927,15 +845,14 @@ def test_package_mode_bootstraps_changelog_from_package_root(tmp_path: Path) ->
     assert (changelog_root / "unreleased").is_dir()
     assert not (changelog_root / "releases").exists()
 
-    created_entries = list((changelog_root / "unreleased").glob("*.md"))
+    created_entries = list_entry_files(changelog_root / "unreleased")
     assert created_entries, "Expected an entry to be created in package mode"
 
     assert not (package_dir / "config.yaml").exists()
     assert not (changelog_root / "config.yaml").exists()
 
 
-def test_init_creates_standalone_changelog_subdirectory(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_creates_standalone_changelog_subdirectory(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "myproject"
     project_dir.mkdir()
 
@@ -976,8 +893,9 @@ def test_init_creates_standalone_changelog_subdirectory(tmp_path: Path) -> None:
     assert config.repository == "owner/repo"
 
 
-def test_init_interactive_prompts_for_standalone_metadata(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_interactive_prompts_for_standalone_metadata(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "interactive"
     project_dir.mkdir()
 
@@ -1001,8 +919,7 @@ def test_init_interactive_prompts_for_standalone_metadata(tmp_path: Path) -> Non
     assert config.repository == "owner/repo"
 
 
-def test_init_yes_requires_id_in_standalone_mode(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_yes_requires_id_in_standalone_mode(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "missing-id"
     project_dir.mkdir()
 
@@ -1017,8 +934,7 @@ def test_init_yes_requires_id_in_standalone_mode(tmp_path: Path) -> None:
     assert "--id is required when using --yes in standalone mode." in result.output
 
 
-def test_init_auto_detects_package_mode(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_auto_detects_package_mode(tmp_path: Path, runner: CliRunner) -> None:
     package_dir = tmp_path / "workspace"
     package_dir.mkdir()
     _write_package_metadata(package_dir / "package.yaml", package_id="workspace", name="Workspace")
@@ -1038,8 +954,9 @@ def test_init_auto_detects_package_mode(tmp_path: Path) -> None:
     assert not (changelog_root / "config.yaml").exists()
 
 
-def test_init_auto_detects_package_mode_with_explicit_root(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_auto_detects_package_mode_with_explicit_root(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     package_dir = tmp_path / "workspace"
     package_dir.mkdir()
     _write_package_metadata(package_dir / "package.yaml", package_id="workspace", name="Workspace")
@@ -1054,8 +971,7 @@ def test_init_auto_detects_package_mode_with_explicit_root(tmp_path: Path) -> No
     assert not (changelog_root / "config.yaml").exists()
 
 
-def test_init_can_force_standalone_mode_in_package_root(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_can_force_standalone_mode_in_package_root(tmp_path: Path, runner: CliRunner) -> None:
     package_dir = tmp_path / "workspace"
     package_dir.mkdir()
     _write_package_metadata(package_dir / "package.yaml", package_id="workspace", name="Workspace")
@@ -1079,8 +995,9 @@ def test_init_can_force_standalone_mode_in_package_root(tmp_path: Path) -> None:
     assert config.name == "Workspace"
 
 
-def test_init_from_empty_changelog_directory_uses_current_directory(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_from_empty_changelog_directory_uses_current_directory(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "myproject"
     changelog_root = project_dir / "changelog"
     changelog_root.mkdir(parents=True)
@@ -1098,8 +1015,9 @@ def test_init_from_empty_changelog_directory_uses_current_directory(tmp_path: Pa
     assert not (changelog_root / "changelog").exists()
 
 
-def test_init_root_changelog_uses_parent_for_default_metadata(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_root_changelog_uses_parent_for_default_metadata(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "my-project"
     changelog_root = project_dir / "changelog"
     changelog_root.mkdir(parents=True)
@@ -1121,8 +1039,7 @@ def test_init_root_changelog_uses_parent_for_default_metadata(tmp_path: Path) ->
     assert config.name == "My Project"
 
 
-def test_init_errors_when_project_already_exists(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_errors_when_project_already_exists(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "existing"
     changelog_root = project_dir / "changelog"
     _bootstrap_changelog_project(changelog_root)
@@ -1138,8 +1055,9 @@ def test_init_errors_when_project_already_exists(tmp_path: Path) -> None:
     assert f"A tenzir-ship project already exists at {changelog_root.resolve()}." in result.output
 
 
-def test_init_with_explicit_nonexistent_root_creates_target(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_init_with_explicit_nonexistent_root_creates_target(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     workspace = tmp_path / "workspace"
     workspace.mkdir()
 
@@ -1166,8 +1084,7 @@ def test_init_with_explicit_nonexistent_root_creates_target(tmp_path: Path) -> N
     assert (target_root / "unreleased").is_dir()
 
 
-def test_non_init_commands_reject_nonexistent_root(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_non_init_commands_reject_nonexistent_root(tmp_path: Path, runner: CliRunner) -> None:
     missing_root = tmp_path / "missing"
 
     show_result = runner.invoke(cli, ["--root", str(missing_root), "show"])
@@ -1193,9 +1110,8 @@ def test_non_init_commands_reject_nonexistent_root(tmp_path: Path) -> None:
     assert not missing_root.exists()
 
 
-def test_bootstrap_creates_changelog_subdirectory(tmp_path: Path) -> None:
+def test_bootstrap_creates_changelog_subdirectory(tmp_path: Path, runner: CliRunner) -> None:
     """Running add in empty directory should create changelog/ subdirectory."""
-    runner = CliRunner()
     project_dir = tmp_path / "myproject"
     project_dir.mkdir()
 
@@ -1233,8 +1149,9 @@ def test_bootstrap_creates_changelog_subdirectory(tmp_path: Path) -> None:
     assert not (project_dir / "unreleased").exists()
 
 
-def test_add_handles_keyboard_interrupt(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_add_handles_keyboard_interrupt(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
@@ -1264,8 +1181,7 @@ def test_add_handles_keyboard_interrupt(monkeypatch: pytest.MonkeyPatch, tmp_pat
     assert "operation cancelled by user (Ctrl+C)." in plain_output
 
 
-def test_show_orders_rows_oldest_to_newest(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_show_orders_rows_oldest_to_newest(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
@@ -1306,31 +1222,22 @@ def test_show_orders_rows_oldest_to_newest(tmp_path: Path) -> None:
 
     plain_output = click.utils.strip_ansi(result.output)
     # With borderless tables, check that titles appear in oldest-to-newest order
-    # by finding their line positions in the output
-    oldest_pos = plain_output.find("Oldest")
-    middle_pos = plain_output.find("Middle")
-    newest_pos = plain_output.find("Newest")
-    assert oldest_pos < middle_pos < newest_pos, "Entries should be ordered oldest to newest"
-    # Verify all three entries are present
-    assert "Oldest" in plain_output
-    assert "Middle" in plain_output
-    assert "Newest" in plain_output
-
-    newest_card = runner.invoke(cli, ["--root", str(project_dir), "show", "-c", "1"])
-    assert newest_card.exit_code == 0, newest_card.output
-    newest_plain = click.utils.strip_ansi(newest_card.output)
+    # by finding their positions in the output
+    positions = [plain_output.find(title) for title in ("Oldest", "Middle", "Newest")]
+    assert -1 not in positions, "All three entries should be listed"
+    assert positions == sorted(positions), "Entries should be ordered oldest to newest"
+
+    changelog = Changelog(root=project_dir)
+    newest_plain = click.utils.strip_ansi(_capture_show(changelog, identifiers=["1"], view="card"))
     assert "Newest" in newest_plain
     assert "Middle" not in newest_plain
     assert "Oldest" not in newest_plain
 
-    oldest_card = runner.invoke(cli, ["--root", str(project_dir), "show", "-c", "3"])
-    assert oldest_card.exit_code == 0, oldest_card.output
-    oldest_plain = click.utils.strip_ansi(oldest_card.output)
+    oldest_plain = click.utils.strip_ansi(_capture_show(changelog, identifiers=["3"], view="card"))
     assert "Oldest" in oldest_plain
 
 
-def test_compact_export_style_from_config(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_compact_export_style_from_config(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     config_path = project_dir / "config.yaml"
@@ -1379,9 +1286,9 @@ def test_compact_export_style_from_config(tmp_path: Path) -> None:
     assert release_result.exit_code == 0, release_result.output
 
     release_notes_path = project_dir / "releases" / "v0.1.0" / "notes.md"
-    release_notes = release_notes_path.read_text(encoding="utf-8")
-    assert "- Adds compact defaults." in release_notes
-    assert "### Compact Feature" not in release_notes
+    release_notes = release_notes_path.read_bytes()
+    assert b"- Adds compact defaults." in release_notes
+    assert b"### Compact Feature" not in release_notes
 
     get_result = runner.invoke(
         cli,
@@ -1398,9 +1305,8 @@ def test_compact_export_style_from_config(tmp_path: Path) -> None:
     assert "- Adds compact defaults." in get_result.output
 
 
-def test_get_unreleased_scope(tmp_path: Path) -> None:
+def test_get_unreleased_scope(tmp_path: Path, runner: CliRunner) -> None:
     """Test the 'unreleased' scope token for filtering to unreleased entries."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     (project_dir / "config.yaml").write_text(
@@ -1479,7 +1385,7 @@ def test_get_unreleased_scope(tmp_path: Path) -> None:
         ],
     )
     assert json_result.exit_code == 0, json_result.output
-    payload = json.loads(json_result.output)
+    payload = json.loads(json_result.stdout_bytes)
     assert payload["version"] is None
     assert payload["entries"]
     pending_entry = payload["entries"][0]
@@ -1494,9 +1400,8 @@ def test_get_unreleased_scope(tmp_path: Path) -> None:
     assert table_result.exit_code == 0, table_result.output
 
 
-def test_unreleased_scope_cannot_combine_with_versions(tmp_path: Path) -> None:
+def test_unreleased_scope_cannot_combine_with_versions(tmp_path: Path, runner: CliRunner) -> None:
     """Test that 'unreleased' scope cannot be combined with version identifiers."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     (project_dir / "config.yaml").write_text(
@@ -1552,9 +1457,8 @@ def test_unreleased_scope_cannot_combine_with_versions(tmp_path: Path) -> None:
     )
 
 
-def test_all_scope_cannot_combine_with_identifiers(tmp_path: Path) -> None:
+def test_all_scope_cannot_combine_with_identifiers(tmp_path: Path, runner: CliRunner) -> None:
     """Test that 'all' scope cannot be combined with other identifiers."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     (project_dir / "config.yaml").write_text(
@@ -1608,13 +1512,12 @@ def test_all_scope_cannot_combine_with_identifiers(tmp_path: Path) -> None:
     assert "'all' scope cannot be combined with other identifiers" in combined_result.output
 
 
-def test_unreleased_scope_allows_v_prefixed_entry_ids(tmp_path: Path) -> None:
+def test_unreleased_scope_allows_v_prefixed_entry_ids(tmp_path: Path, runner: CliRunner) -> None:
     """Test that 'unreleased' scope allows entry IDs starting with 'v' that are not release versions.
 
     Entry IDs like 'v2-draft-feature' should be allowed with the 'unreleased' scope
     because they are not known release versions, even though they start with 'v'.
     """
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     (project_dir / "config.yaml").write_text(
@@ -1656,8 +1559,7 @@ def test_unreleased_scope_allows_v_prefixed_entry_ids(tmp_path: Path) -> None:
     assert "Draft V2 Feature" in plain_output
 
 
-def test_component_filtering(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_component_filtering(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     (project_dir / "config.yaml").write_text(
@@ -1756,7 +1658,7 @@ def test_component_filtering(tmp_path: Path) -> None:
         ],
     )
     assert json_docs.exit_code == 0, json_docs.output
-    payload = json.loads(json_docs.output)
+    payload = json.loads(json_docs.stdout_bytes)
     assert len(payload["entries"]) == 1
     assert payload["entries"][0]["title"] == "Docs Entry"
     assert payload["entries"][0]["components"] == ["docs"]
@@ -1775,8 +1677,7 @@ def test_component_filtering(tmp_path: Path) -> None:
     assert "Unknown component filter" in bad_filter.output
 
 
-def test_release_create_appends_entries(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_appends_entries(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -1830,10 +1731,10 @@ def test_release_create_appends_entries(tmp_path: Path) -> None:
     assert create_initial.exit_code == 0, create_initial.output
 
     release_entries_dir = project_dir / "releases" / "v0.3.0" / "entries"
-    initial_entries = {path.stem for path in release_entries_dir.glob("*.md")}
+    initial_entries = {path.stem for path in list_entry_files(release_entries_dir)}
     assert len(initial_entries) == 2
     unreleased_dir = project_dir / "unreleased"
-    assert not any(unreleased_dir.glob("*.md"))
+    assert not list_entry_files(unreleased_dir)
     assert (unreleased_dir / ENTRY_DIRECTORY_ANCHOR).exists()
 
     add_gamma = runner.invoke(
@@ -1854,7 +1755,7 @@ def test_release_create_appends_entries(tmp_path: Path) -> None:
     )
     assert add_gamma.exit_code == 0, add_gamma.output
 
-    gamma_entry = next(path.stem for path in unreleased_dir.glob("*.md"))
+    gamma_entry = list_entry_files(unreleased_dir)[0].stem
 
     append_preview = runner.invoke(
         cli,
@@ -1881,20 +1782,19 @@ def test_release_create_appends_entries(tmp_path: Path) -> None:
         ],
     )
     assert append_apply.exit_code == 0, append_apply.output
-    new_release_entries = {path.stem for path in release_entries_dir.glob("*.md")}
+    new_release_entries = {path.stem for path in list_entry_files(release_entries_dir)}
     assert gamma_entry in new_release_entries
-    assert not any(unreleased_dir.glob("*.md"))
+    assert not list_entry_files(unreleased_dir)
     assert (unreleased_dir / ENTRY_DIRECTORY_ANCHOR).exists()
 
     manifest_path = project_dir / "releases" / "v0.3.0" / "manifest.yaml"
-    manifest_data = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(manifest_path)
     assert "entries" not in manifest_data
-    notes_text = (project_dir / "releases" / "v0.3.0" / "notes.md").read_text(encoding="utf-8")
-    assert "Gamma Change" in notes_text
+    notes_text = (project_dir / "releases" / "v0.3.0" / "notes.md").read_bytes()
+    assert b"Gamma Change" in notes_text
 
 
-def test_release_notes_collapse_soft_breaks(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_notes_collapse_soft_breaks(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
@@ -1928,13 +1828,12 @@ def test_release_notes_collapse_soft_breaks(tmp_path: Path) -> None:
 
     notes_path = project_dir / "releases" / "v0.1.0" / "notes.md"
     assert notes_path.exists()
-    notes_text = notes_path.read_text(encoding="utf-8")
-    assert "table with backward-counting row numbers" in notes_text
-    assert "table with\nbackward-counting" not in notes_text
+    notes_text = notes_path.read_bytes()
+    assert b"table with backward-counting row numbers" in notes_text
+    assert b"table with\nbackward-counting" not in notes_text
 
 
-def test_release_create_semver_bumps(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_semver_bumps(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -2106,8 +2005,9 @@ def test_release_create_semver_bumps(tmp_path: Path) -> None:
     assert (empty_dir / "releases" / "v0.0.1").exists()
 
 
-def test_release_create_implicit_auto_bump_uses_entry_types(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_implicit_auto_bump_uses_entry_types(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -2211,8 +2111,9 @@ def test_release_create_implicit_auto_bump_uses_entry_types(tmp_path: Path) -> N
     assert major_release.stdout.strip() == "v2.0.0"
 
 
-def test_release_create_implicit_breaking_bump_starts_at_zero_minor(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_implicit_breaking_bump_starts_at_zero_minor(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -2242,8 +2143,9 @@ def test_release_create_implicit_breaking_bump_starts_at_zero_minor(tmp_path: Pa
     assert release_result.stdout.strip() == "v0.1.0"
 
 
-def test_release_create_implicit_breaking_bump_stays_below_one(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_implicit_breaking_bump_stays_below_one(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project" / "changelog"
     project_dir.mkdir(parents=True)
     pyproject_path = project_dir.parent / "pyproject.toml"
@@ -2298,7 +2200,7 @@ def test_release_create_implicit_breaking_bump_stays_below_one(tmp_path: Path) -
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_result.exit_code == 0, stats_result.output
-    stats = json.loads(stats_result.output)
+    stats = json.loads(stats_result.stdout_bytes)
     assert stats["parent"]["releases"]["next"] == "v0.5.0"
 
     preview_result = runner.invoke(
@@ -2342,8 +2244,9 @@ def test_release_create_implicit_breaking_bump_stays_below_one(tmp_path: Path) -
     assert major_release.stdout.strip() == "v1.0.0"
 
 
-def test_release_create_explicit_version_transitions_zero_major_to_one(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_explicit_version_transitions_zero_major_to_one(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -2396,8 +2299,9 @@ def test_release_create_explicit_version_transitions_zero_major_to_one(tmp_path:
     assert stable_release.stdout.strip() == "v1.0.0"
 
 
-def test_release_create_implicit_auto_bump_uses_highest_severity(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_implicit_auto_bump_uses_highest_severity(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -2510,8 +2414,9 @@ def test_release_create_implicit_auto_bump_uses_highest_severity(tmp_path: Path)
     assert major_release.stdout.strip() == "v2.0.0"
 
 
-def test_release_create_implicit_auto_bump_requires_entries(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_implicit_auto_bump_requires_entries(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -2555,8 +2460,9 @@ def test_release_create_implicit_auto_bump_requires_entries(tmp_path: Path) -> N
     assert "Cannot auto-bump release version" in auto_without_entries.output
 
 
-def test_release_create_rejects_multiple_manual_bump_flags(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_rejects_multiple_manual_bump_flags(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -2594,8 +2500,9 @@ def test_release_create_rejects_multiple_manual_bump_flags(tmp_path: Path) -> No
     assert "Use only one of --patch, --minor, or --major." in invalid.output
 
 
-def test_release_create_updates_detected_pyproject_version(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_updates_detected_pyproject_version(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -2641,8 +2548,8 @@ def test_release_create_updates_detected_pyproject_version(tmp_path: Path) -> No
 
 def test_release_create_runs_uv_lock_for_detected_pyproject_with_uv_lock(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -2728,8 +2635,8 @@ printf '%s\\n' "$original" > "$project/uv-args.txt"
 
 def test_release_create_fails_before_pyproject_update_when_uv_is_missing(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -2781,8 +2688,8 @@ def test_release_create_fails_before_pyproject_update_when_uv_is_missing(
 
 def test_release_create_restores_version_files_when_uv_lock_fails(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -2865,8 +2772,8 @@ exit 42
 
 def test_release_create_updates_configured_pyproject_version_after_multiline_string(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -2929,8 +2836,9 @@ def test_release_create_updates_configured_pyproject_version_after_multiline_str
     assert 'version = "1.2.3"' in updated_pyproject
 
 
-def test_release_create_skips_dynamic_pyproject_version_in_auto_mode(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_skips_dynamic_pyproject_version_in_auto_mode(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -2972,8 +2880,9 @@ def test_release_create_skips_dynamic_pyproject_version_in_auto_mode(tmp_path: P
     assert pyproject_path.read_text(encoding="utf-8") == original_pyproject
 
 
-def test_release_create_falls_back_to_poetry_version_in_auto_mode(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_falls_back_to_poetry_version_in_auto_mode(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3029,8 +2938,8 @@ def test_release_create_falls_back_to_poetry_version_in_auto_mode(tmp_path: Path
 
 def test_release_create_falls_back_to_poetry_without_touching_array_table_versions(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3085,8 +2994,9 @@ def test_release_create_falls_back_to_poetry_without_touching_array_table_versio
     assert 'version = "1.2.3"' in poetry_section
 
 
-def test_release_create_skips_workspace_cargo_manifest_in_auto_mode(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_skips_workspace_cargo_manifest_in_auto_mode(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3130,8 +3040,8 @@ def test_release_create_skips_workspace_cargo_manifest_in_auto_mode(tmp_path: Pa
 
 def test_release_create_updates_workspace_package_cargo_version_in_auto_mode(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3186,8 +3096,9 @@ def test_release_create_updates_workspace_package_cargo_version_in_auto_mode(
     assert 'version = "1.2.3"' in workspace_package_section
 
 
-def test_release_create_updates_configured_workspace_package_cargo_version(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_updates_configured_workspace_package_cargo_version(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3250,8 +3161,9 @@ def test_release_create_updates_configured_workspace_package_cargo_version(tmp_p
     assert 'version = "2.3.4"' in workspace_package_section
 
 
-def test_release_create_updates_detected_package_json_version(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_updates_detected_package_json_version(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3296,8 +3208,67 @@ def test_release_create_updates_detected_package_json_version(tmp_path: Path) ->
     assert package_payload["version"] == "2.3.4"
 
 
-def test_release_create_updates_detected_package_lock_version(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_auto_detection_follows_filesystem_case_sensitivity(tmp_path: Path) -> None:
+    """A differently cased manifest is found exactly when the filesystem opens it."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "Package.json").write_text('{"version": "0.1.0"}\n', encoding="utf-8")
+    case_insensitive = (project_dir / "package.json").is_file()
+
+    targets = resolve_version_file_targets(project_dir, [])
+
+    expected = [project_dir.resolve() / "package.json"] if case_insensitive else []
+    assert targets == expected
+
+
+def test_release_create_preserves_package_json_formatting(
+    tmp_path: Path, runner: CliRunner
+) -> None:
+    project_dir = tmp_path / "project"
+    changelog_dir = project_dir / "changelog"
+    changelog_dir.mkdir(parents=True)
+
+    package_json_path = project_dir / "package.json"
+    original_content = (
+        "{\n"
+        '    "name": "demo",\n'
+        '    "dependencies": { "left-pad": { "version": "0.1.0" } },\n'
+        '    "version": "0.1.0"\n'
+        "}"
+    )
+    package_json_path.write_text(original_content, encoding="utf-8")
+
+    add_result = runner.invoke(
+        cli,
+        [
+            "--root",
+            str(changelog_dir),
+            "add",
+            "--title",
+            "Package bump",
+            "--type",
+            "feature",
+            "--description",
+            "Verifies package.json formatting is kept.",
+            "--author",
+            "codex",
+        ],
+    )
+    assert add_result.exit_code == 0, add_result.output
+
+    create_result = runner.invoke(
+        cli,
+        ["--root", str(changelog_dir), "release", "create", "v2.3.4", "--yes"],
+    )
+    assert create_result.exit_code == 0, create_result.output
+    assert package_json_path.read_text(encoding="utf-8") == original_content.replace(
+        '"version": "0.1.0"\n', '"version": "2.3.4"\n'
+    )
+
+
+def test_release_create_updates_detected_package_lock_version(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3364,8 +3335,8 @@ def test_release_create_updates_detected_package_lock_version(tmp_path: Path) ->
 
 def test_release_create_updates_stale_package_lock_when_package_json_is_current(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3428,8 +3399,9 @@ def test_release_create_updates_stale_package_lock_when_package_json_is_current(
     assert package_lock_payload["packages"][""]["version"] == "2.3.4"
 
 
-def test_release_create_skips_package_json_without_version_in_auto_mode(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_skips_package_json_without_version_in_auto_mode(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3477,8 +3449,9 @@ def test_release_create_skips_package_json_without_version_in_auto_mode(tmp_path
     assert package_lock_path.read_text(encoding="utf-8") == original_lock_content
 
 
-def test_release_create_version_bump_mode_off_skips_version_files(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_version_bump_mode_off_skips_version_files(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3530,8 +3503,7 @@ def test_release_create_version_bump_mode_off_skips_version_files(tmp_path: Path
     assert 'version = "0.1.0"' in pyproject_path.read_text(encoding="utf-8")
 
 
-def test_release_create_updates_configured_version_file(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_updates_configured_version_file(tmp_path: Path, runner: CliRunner) -> None:
     workspace_dir = tmp_path / "workspace"
     changelog_dir = workspace_dir / "changelog"
     python_dir = workspace_dir / "python"
@@ -3594,8 +3566,8 @@ def test_release_create_updates_configured_version_file(tmp_path: Path) -> None:
 
 def test_release_create_editing_old_release_does_not_downgrade_version_file(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     changelog_dir = project_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3687,8 +3659,9 @@ def test_release_create_editing_old_release_does_not_downgrade_version_file(
     assert 'version = "1.1.0"' in pyproject_path.read_text(encoding="utf-8")
 
 
-def test_release_create_fails_for_unsupported_configured_version_file(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_fails_for_unsupported_configured_version_file(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     workspace_dir = tmp_path / "workspace"
     changelog_dir = workspace_dir / "changelog"
     changelog_dir.mkdir(parents=True)
@@ -3738,9 +3711,8 @@ def test_release_create_fails_for_unsupported_configured_version_file(tmp_path:
     assert not (changelog_dir / "releases" / "v1.0.0").exists()
 
 
-def test_release_create_bump_from_implicit_zero(tmp_path: Path) -> None:
+def test_release_create_bump_from_implicit_zero(tmp_path: Path, runner: CliRunner) -> None:
     """Test that bump flags work with implicit 0.0.0 base when no releases exist."""
-    runner = CliRunner()
 
     # Test --minor creates 0.1.0
     minor_dir = tmp_path / "minor_project"
@@ -3811,8 +3783,9 @@ def test_release_create_bump_from_implicit_zero(tmp_path: Path) -> None:
     assert (major_dir / "releases" / "v1.0.0").exists()
 
 
-def test_release_create_patch_bump_allows_intro_only_release(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_patch_bump_allows_intro_only_release(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -3867,7 +3840,7 @@ def test_release_create_patch_bump_allows_intro_only_release(tmp_path: Path) ->
     release_dir = project_dir / "releases" / "v1.0.1"
     assert release_dir.exists()
 
-    manifest_data = yaml.safe_load((release_dir / "manifest.yaml").read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(release_dir / "manifest.yaml")
     assert manifest_data["intro"] == intro_text
     assert "entries" not in manifest_data
 
@@ -3876,11 +3849,12 @@ def test_release_create_patch_bump_allows_intro_only_release(tmp_path: Path) ->
 
     release_entries_dir = release_dir / "entries"
     assert release_entries_dir.is_dir()
-    assert list(release_entries_dir.glob("*.md")) == []
+    assert not list_entry_files(release_entries_dir)
 
 
-def test_release_create_explicit_version_allows_intro_only_release(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_explicit_version_allows_intro_only_release(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -3933,14 +3907,15 @@ def test_release_create_explicit_version_allows_intro_only_release(tmp_path: Pat
     assert next_release.stdout.strip() == "v2.0.1"
 
     release_dir = project_dir / "releases" / "v2.0.1"
-    manifest_data = yaml.safe_load((release_dir / "manifest.yaml").read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(release_dir / "manifest.yaml")
     assert manifest_data["intro"] == intro_text
     assert "entries" not in manifest_data
     assert (release_dir / "notes.md").read_text(encoding="utf-8").strip() == intro_text
 
 
-def test_release_create_rejects_empty_release_without_intro(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_rejects_empty_release_without_intro(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -3992,9 +3967,8 @@ def test_release_create_rejects_empty_release_without_intro(tmp_path: Path) -> N
     )
 
 
-def test_show_release_mode(tmp_path: Path) -> None:
+def test_show_release_mode(tmp_path: Path, runner: CliRunner) -> None:
     """Test show --release flag as replacement for release notes command."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -4078,7 +4052,7 @@ def test_show_release_mode(tmp_path: Path) -> None:
         ],
     )
     assert notes_json.exit_code == 0, notes_json.output
-    payload = json.loads(notes_json.output)
+    payload = json.loads(notes_json.stdout_bytes)
     # With --release, output is always an array
     assert isinstance(payload, list)
     assert len(payload) == 1
@@ -4100,8 +4074,9 @@ def test_show_release_mode(tmp_path: Path) -> None:
     assert "Epsilon Fix" in show_unreleased.output
 
 
-def test_show_release_mode_normalizes_legacy_manifest_versions(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_show_release_mode_normalizes_legacy_manifest_versions(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
 
@@ -4133,7 +4108,7 @@ def test_show_release_mode_normalizes_legacy_manifest_versions(tmp_path: Path) -
         ],
     )
     assert result.exit_code == 0, result.output
-    payload = json.loads(result.output)
+    payload = json.loads(result.stdout_bytes)
     assert isinstance(payload, list)
     assert len(payload) == 1
     assert payload[0]["version"] == "v1.2.3"
@@ -4141,8 +4116,9 @@ def test_show_release_mode_normalizes_legacy_manifest_versions(tmp_path: Path) -
     assert payload[0]["entries"][0]["id"] == "legacy-feature"
 
 
-def test_release_publish_uses_gh(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_publish_uses_gh(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -4178,7 +4154,7 @@ def test_release_publish_uses_gh(monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     assert create_release.exit_code == 0, create_release.output
 
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = "tenzir/example"
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -4226,9 +4202,8 @@ def test_release_publish_uses_gh(monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 
 
 def test_release_publish_composes_github_title_from_release_title(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner, title="Faster ingest")
 
@@ -4255,21 +4230,16 @@ def test_release_publish_composes_github_title_from_release_title(
 
     assert publish_result.exit_code == 0, publish_result.output
     assert _captured_title(commands[-1]) == "Project v1.0.0: Faster ingest"
-    manifest = yaml.safe_load(
-        (project_dir / "releases" / "v1.0.0" / "manifest.yaml").read_text(encoding="utf-8")
-    )
+    manifest = load_release_manifest_data(project_dir / "releases" / "v1.0.0" / "manifest.yaml")
     assert manifest["title"] == "Faster ingest"
 
 
 def test_release_publish_omits_title_component_when_manifest_has_no_title(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner)
-    manifest = yaml.safe_load(
-        (project_dir / "releases" / "v1.0.0" / "manifest.yaml").read_text(encoding="utf-8")
-    )
+    manifest = load_release_manifest_data(project_dir / "releases" / "v1.0.0" / "manifest.yaml")
     assert "title" not in manifest
 
     commands: list[list[str]] = []
@@ -4298,9 +4268,8 @@ def test_release_publish_omits_title_component_when_manifest_has_no_title(
 
 
 def test_release_publish_custom_github_title_format(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner, title="Faster ingest")
 
@@ -4339,9 +4308,8 @@ def test_release_publish_custom_github_title_format(
 
 
 def test_release_publish_retry_hint_preserves_bracketed_title(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -4379,7 +4347,7 @@ def test_release_publish_retry_hint_preserves_bracketed_title(
     assert create_release.exit_code == 0, create_release.output
 
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = "tenzir/example"
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -4417,9 +4385,8 @@ def test_release_publish_retry_hint_preserves_bracketed_title(
 
 
 def test_release_publish_updates_existing_release(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -4455,7 +4422,7 @@ def test_release_publish_updates_existing_release(
     assert create_release.exit_code == 0, create_release.output
 
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = "tenzir/example"
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -4495,8 +4462,9 @@ def test_release_publish_updates_existing_release(
     assert _captured_title(calls[1]) == "Project v4.0.0"
 
 
-def test_release_publish_handles_abort(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_publish_handles_abort(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -4532,7 +4500,7 @@ def test_release_publish_handles_abort(monkeypatch: pytest.MonkeyPatch, tmp_path
     assert create_release.exit_code == 0, create_release.output
 
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = "tenzir/example"
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -4570,8 +4538,7 @@ def test_release_publish_handles_abort(monkeypatch: pytest.MonkeyPatch, tmp_path
     assert "operation cancelled by user (Ctrl+C)." in plain_output
 
 
-def test_release_publish_creates_git_tag(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_publish_creates_git_tag(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     changelog_root = project_dir / "changelog"
@@ -4718,8 +4685,9 @@ def test_release_publish_creates_git_tag(tmp_path: Path) -> None:
     assert any(line.startswith("release create v9.9.9") for line in gh_calls)
 
 
-def test_release_publish_creates_tag_prefixed_release_commit(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_publish_creates_tag_prefixed_release_commit(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     changelog_root = project_dir / "changelog"
@@ -4856,8 +4824,7 @@ def test_release_publish_creates_tag_prefixed_release_commit(tmp_path: Path) ->
     assert any(line.startswith("release create v9.9.9") for line in gh_calls)
 
 
-def test_release_publish_skips_existing_tag(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_publish_skips_existing_tag(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     changelog_root = project_dir / "changelog"
@@ -4991,14 +4958,28 @@ def test_release_publish_skips_existing_tag(tmp_path: Path) -> None:
     assert any(line.startswith("release create v9.9.9") for line in gh_calls)
 
 
-def test_add_description_file(tmp_path: Path) -> None:
-    """Test --description-file reads content from a file."""
-    runner = CliRunner()
+@pytest.mark.parametrize(
+    ("description", "use_stdin"),
+    [
+        pytest.param("This is the description from a file.", False, id="file"),
+        pytest.param("Description from stdin.", True, id="stdin"),
+    ],
+)
+def test_add_description_file(
+    tmp_path: Path, runner: CliRunner, description: str, use_stdin: bool
+) -> None:
+    """Test --description-file reads content from a file, or from stdin for -."""
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
-    desc_file = tmp_path / "desc.md"
-    desc_file.write_text("This is the description from a file.", encoding="utf-8")
+    stdin: str | None = None
+    if use_stdin:
+        source = "-"
+        stdin = description
+    else:
+        desc_file = tmp_path / "desc.md"
+        desc_file.write_text(description, encoding="utf-8")
+        source = str(desc_file)
 
     result = runner.invoke(
         cli,
@@ -5007,55 +4988,25 @@ def test_add_description_file(tmp_path: Path) -> None:
             str(project_dir),
             "add",
             "--title",
-            "File Description Test",
+            "Description File Test",
             "--type",
             "feature",
             "--description-file",
-            str(desc_file),
+            source,
         ],
+        input=stdin,
         env={"TENZIR_CHANGELOG_AUTHOR": "test-user"},
     )
     assert result.exit_code == 0, result.output
 
-    entry_files = list((project_dir / "unreleased").glob("*.md"))
+    entry_files = list_entry_files(project_dir / "unreleased")
     assert len(entry_files) == 1
     content = entry_files[0].read_text(encoding="utf-8")
-    assert "This is the description from a file." in content
+    assert description in content
 
 
-def test_add_description_file_stdin(tmp_path: Path) -> None:
-    """Test --description-file - reads from stdin."""
-    runner = CliRunner()
-    project_dir = tmp_path / "project"
-    project_dir.mkdir()
-
-    result = runner.invoke(
-        cli,
-        [
-            "--root",
-            str(project_dir),
-            "add",
-            "--title",
-            "Stdin Description Test",
-            "--type",
-            "feature",
-            "--description-file",
-            "-",
-        ],
-        input="Description from stdin.",
-        env={"TENZIR_CHANGELOG_AUTHOR": "test-user"},
-    )
-    assert result.exit_code == 0, result.output
-
-    entry_files = list((project_dir / "unreleased").glob("*.md"))
-    assert len(entry_files) == 1
-    content = entry_files[0].read_text(encoding="utf-8")
-    assert "Description from stdin." in content
-
-
-def test_add_description_mutual_exclusivity(tmp_path: Path) -> None:
+def test_add_description_mutual_exclusivity(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --description and --description-file cannot be used together."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5082,9 +5033,8 @@ def test_add_description_mutual_exclusivity(tmp_path: Path) -> None:
     assert "Use only one of --description or --description-file" in result.output
 
 
-def test_add_description_file_not_found(tmp_path: Path) -> None:
+def test_add_description_file_not_found(tmp_path: Path, runner: CliRunner) -> None:
     """Test error handling for missing description file."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5106,9 +5056,8 @@ def test_add_description_file_not_found(tmp_path: Path) -> None:
     assert "not found" in result.output.lower()
 
 
-def test_add_description_file_empty(tmp_path: Path) -> None:
+def test_add_description_file_empty(tmp_path: Path, runner: CliRunner) -> None:
     """Test that empty description file results in empty body."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5132,13 +5081,12 @@ def test_add_description_file_empty(tmp_path: Path) -> None:
     )
     assert result.exit_code == 0, result.output
 
-    entry_files = list((project_dir / "unreleased").glob("*.md"))
+    entry_files = list_entry_files(project_dir / "unreleased")
     assert len(entry_files) == 1
 
 
-def test_add_co_author_with_explicit_author(tmp_path: Path) -> None:
+def test_add_co_author_with_explicit_author(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --co-author is additive to explicit --author."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5162,7 +5110,7 @@ def test_add_co_author_with_explicit_author(tmp_path: Path) -> None:
     )
     assert result.exit_code == 0, result.output
 
-    entry_files = list((project_dir / "unreleased").glob("*.md"))
+    entry_files = list_entry_files(project_dir / "unreleased")
     assert len(entry_files) == 1
     entry_text = entry_files[0].read_text(encoding="utf-8")
     # Both authors should be present
@@ -5171,9 +5119,8 @@ def test_add_co_author_with_explicit_author(tmp_path: Path) -> None:
     assert "claude" in entry_text
 
 
-def test_add_multiple_co_authors(tmp_path: Path) -> None:
+def test_add_multiple_co_authors(tmp_path: Path, runner: CliRunner) -> None:
     """Test that multiple --co-author flags work correctly."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5199,15 +5146,14 @@ def test_add_multiple_co_authors(tmp_path: Path) -> None:
     )
     assert result.exit_code == 0, result.output
 
-    entry_files = list((project_dir / "unreleased").glob("*.md"))
+    entry_files = list_entry_files(project_dir / "unreleased")
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     assert entry.metadata.get("authors") == ["mavam", "claude", "copilot"]
 
 
-def test_add_co_author_deduplication(tmp_path: Path) -> None:
+def test_add_co_author_deduplication(tmp_path: Path, runner: CliRunner) -> None:
     """Test that duplicate authors are removed while preserving order."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5233,7 +5179,7 @@ def test_add_co_author_deduplication(tmp_path: Path) -> None:
     )
     assert result.exit_code == 0, result.output
 
-    entry_files = list((project_dir / "unreleased").glob("*.md"))
+    entry_files = list_entry_files(project_dir / "unreleased")
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     # mavam should appear only once, order preserved
@@ -5241,10 +5187,9 @@ def test_add_co_author_deduplication(tmp_path: Path) -> None:
 
 
 def test_add_co_author_without_explicit_author(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: CliRunner
 ) -> None:
     """Test that --co-author triggers author inference and adds to it."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5269,16 +5214,15 @@ def test_add_co_author_without_explicit_author(
     )
     assert result.exit_code == 0, result.output
 
-    entry_files = list((project_dir / "unreleased").glob("*.md"))
+    entry_files = list_entry_files(project_dir / "unreleased")
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     # Should have inferred user first, then co-author
     assert entry.metadata.get("authors") == ["inferred-user", "claude"]
 
 
-def test_explicit_links_flag_in_show_command(tmp_path: Path) -> None:
+def test_explicit_links_flag_in_show_command(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --explicit-links converts @mentions and PRs to Markdown links."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5346,9 +5290,8 @@ def test_explicit_links_flag_in_show_command(tmp_path: Path) -> None:
     assert "[#42](https://github.com/octocat/test-repo/pull/42)" in show_linked_result.output
 
 
-def test_explicit_links_flag_in_show_release_command(tmp_path: Path) -> None:
+def test_explicit_links_flag_in_show_release_command(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --explicit-links works in show --release command."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5431,9 +5374,8 @@ def test_explicit_links_flag_in_show_release_command(tmp_path: Path) -> None:
     assert "[#99](https://github.com/octocat/test-repo/pull/99)" in notes_linked_result.output
 
 
-def test_explicit_links_preserves_full_names(tmp_path: Path) -> None:
+def test_explicit_links_preserves_full_names(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --explicit-links preserves full names without linking."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5474,9 +5416,8 @@ def test_explicit_links_preserves_full_names(tmp_path: Path) -> None:
     assert "[@Jane Doe]" not in show_result.output
 
 
-def test_explicit_links_without_repository(tmp_path: Path) -> None:
+def test_explicit_links_without_repository(tmp_path: Path, runner: CliRunner) -> None:
     """Test --explicit-links behavior when no repository is configured."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5528,13 +5469,12 @@ def test_explicit_links_without_repository(tmp_path: Path) -> None:
     assert "[#42](" not in show_result.output
 
 
-def test_release_create_emits_only_version_to_stdout(tmp_path: Path) -> None:
+def test_release_create_emits_only_version_to_stdout(tmp_path: Path, runner: CliRunner) -> None:
     """Verify that release create emits only the version to stdout.
 
     Status messages (checkmarks, info) must go to stderr so that scripts
     can capture just the version via stdout without ANSI pollution.
     """
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5583,8 +5523,9 @@ def test_release_create_emits_only_version_to_stdout(tmp_path: Path) -> None:
     assert "\033[" not in release_result.stdout
 
 
-def test_release_create_idempotent_run_still_emits_version_to_stdout(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_idempotent_run_still_emits_version_to_stdout(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5637,9 +5578,8 @@ def test_release_create_idempotent_run_still_emits_version_to_stdout(tmp_path: P
     assert "already up to date" in rerun_result.stderr
 
 
-def test_release_create_rejects_non_supported_version(tmp_path: Path) -> None:
+def test_release_create_rejects_non_supported_version(tmp_path: Path, runner: CliRunner) -> None:
     """Test release create enforces the supported release version formats."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5676,8 +5616,9 @@ def test_release_create_rejects_non_supported_version(tmp_path: Path) -> None:
     assert "must use X.Y.Z or X.Y.Z-rc.N" in release_result.output
 
 
-def test_release_create_rejects_unsupported_prerelease_channel(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_rejects_unsupported_prerelease_channel(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5714,8 +5655,7 @@ def test_release_create_rejects_unsupported_prerelease_channel(tmp_path: Path) -
     assert "must use X.Y.Z or X.Y.Z-rc.N" in release_result.output
 
 
-def test_release_create_rejects_release_candidate_zero(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_rejects_release_candidate_zero(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5752,8 +5692,9 @@ def test_release_create_rejects_release_candidate_zero(tmp_path: Path) -> None:
     assert "must use X.Y.Z or X.Y.Z-rc.N" in release_result.output
 
 
-def test_release_create_rejects_empty_explicit_version_argument(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_rejects_empty_explicit_version_argument(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5791,8 +5732,7 @@ def test_release_create_rejects_empty_explicit_version_argument(tmp_path: Path)
     assert not (project_dir / "releases").exists()
 
 
-def test_release_create_fails_on_structure_violation(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_fails_on_structure_violation(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
 
@@ -5825,8 +5765,7 @@ def test_release_create_fails_on_structure_violation(tmp_path: Path) -> None:
     assert not (project_dir / "releases" / "v1.0.0").exists()
 
 
-def test_release_publish_fails_on_structure_violation(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_publish_fails_on_structure_violation(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir, repository="owner/repo")
     (project_dir / "next").mkdir()
@@ -5847,8 +5786,7 @@ def test_release_publish_fails_on_structure_violation(tmp_path: Path) -> None:
     assert "Unexpected item in changelog root: 'next'" in publish_result.output
 
 
-def test_show_warns_on_structure_violation(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_show_warns_on_structure_violation(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "next").mkdir()
@@ -5870,8 +5808,7 @@ def test_show_warns_on_structure_violation(tmp_path: Path) -> None:
     assert "Unexpected item in changelog root: 'next'" in result.output
 
 
-def test_add_warns_on_structure_violation(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_add_warns_on_structure_violation(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "next").mkdir()
@@ -5898,8 +5835,7 @@ def test_add_warns_on_structure_violation(tmp_path: Path) -> None:
     assert "Unexpected item in changelog root: 'next'" in result.output
 
 
-def test_stats_json_includes_next_version(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_stats_json_includes_next_version(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -5950,12 +5886,11 @@ def test_stats_json_includes_next_version(tmp_path: Path) -> None:
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_json.exit_code == 0, stats_json.output
-    payload = json.loads(stats_json.output)
+    payload = json.loads(stats_json.stdout_bytes)
     assert payload["parent"]["releases"]["next"] == "v1.3.0"
 
 
-def test_stats_json_normalizes_legacy_latest_version(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_stats_json_normalizes_legacy_latest_version(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
 
@@ -5989,13 +5924,14 @@ def test_stats_json_normalizes_legacy_latest_version(tmp_path: Path) -> None:
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_json.exit_code == 0, stats_json.output
-    payload = json.loads(stats_json.output)
+    payload = json.loads(stats_json.stdout_bytes)
     assert payload["parent"]["releases"]["latest"] == "v1.2.3"
     assert payload["parent"]["releases"]["next"] == "v1.3.0"
 
 
-def test_stats_json_reports_latest_release_candidate_when_no_stable_exists(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_stats_json_reports_latest_release_candidate_when_no_stable_exists(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6028,7 +5964,7 @@ def test_stats_json_reports_latest_release_candidate_when_no_stable_exists(tmp_p
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_json.exit_code == 0, stats_json.output
-    payload = json.loads(stats_json.output)
+    payload = json.loads(stats_json.stdout_bytes)
     assert payload["parent"]["releases"]["count"] == 1
     assert payload["parent"]["releases"]["latest"] == "v1.2.3-rc.1"
     assert payload["parent"]["entries"]["total"] == 1
@@ -6039,8 +5975,8 @@ def test_stats_json_reports_latest_release_candidate_when_no_stable_exists(tmp_p
 
 def test_stats_json_prefers_latest_stable_over_newer_release_candidate(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6097,7 +6033,7 @@ def test_stats_json_prefers_latest_stable_over_newer_release_candidate(
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_json.exit_code == 0, stats_json.output
-    payload = json.loads(stats_json.output)
+    payload = json.loads(stats_json.stdout_bytes)
     assert payload["parent"]["releases"]["count"] == 1
     assert payload["parent"]["releases"]["latest"] == "v1.2.3"
     assert payload["parent"]["entries"]["total"] == 2
@@ -6108,8 +6044,8 @@ def test_stats_json_prefers_latest_stable_over_newer_release_candidate(
 
 def test_stats_json_next_version_uses_active_release_candidate_target(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6160,7 +6096,7 @@ def test_stats_json_next_version_uses_active_release_candidate_target(
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_json.exit_code == 0, stats_json.output
-    payload = json.loads(stats_json.output)
+    payload = json.loads(stats_json.stdout_bytes)
     assert payload["parent"]["releases"]["latest"] == "v1.0.0-rc.1"
     assert payload["parent"]["releases"]["next"] == "v1.0.0"
 
@@ -6173,8 +6109,9 @@ def test_stats_json_next_version_uses_active_release_candidate_target(
     assert not (project_dir / "releases" / "v2.0.0").exists()
 
 
-def test_stats_json_reports_no_next_version_with_multiple_rc_series(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_stats_json_reports_no_next_version_with_multiple_rc_series(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6209,7 +6146,7 @@ def test_stats_json_reports_no_next_version_with_multiple_rc_series(tmp_path: Pa
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_json.exit_code == 0, stats_json.output
-    payload = json.loads(stats_json.stdout)
+    payload = json.loads(stats_json.stdout_bytes)
     assert payload["parent"]["releases"]["next"] is None
     assert "Multiple release candidate series exist" in stats_json.stderr
     assert "The next release version is unavailable" in stats_json.stderr
@@ -6222,8 +6159,9 @@ def test_stats_json_reports_no_next_version_with_multiple_rc_series(tmp_path: Pa
     assert "Multiple release candidate series exist" in release_result.output
 
 
-def test_stats_json_next_version_is_null_without_unreleased_entries(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_stats_json_next_version_is_null_without_unreleased_entries(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6256,12 +6194,11 @@ def test_stats_json_next_version_is_null_without_unreleased_entries(tmp_path: Pa
         ["--root", str(project_dir), "stats", "--json"],
     )
     assert stats_json.exit_code == 0, stats_json.output
-    payload = json.loads(stats_json.output)
+    payload = json.loads(stats_json.stdout_bytes)
     assert payload["parent"]["releases"]["next"] is None
 
 
-def test_stats_warns_on_structure_violation(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_stats_warns_on_structure_violation(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "next").mkdir()
@@ -6272,8 +6209,7 @@ def test_stats_warns_on_structure_violation(tmp_path: Path) -> None:
     assert "Unexpected item in changelog root: 'next'" in result.output
 
 
-def test_release_version_warns_on_structure_violation(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_version_warns_on_structure_violation(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
 
@@ -6297,8 +6233,9 @@ def test_release_version_warns_on_structure_violation(tmp_path: Path) -> None:
     assert "Unexpected item in changelog root: 'next'" in result.output
 
 
-def test_validate_reports_structure_issues_without_preflight_warning(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_reports_structure_issues_without_preflight_warning(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "next").mkdir()
@@ -6309,8 +6246,7 @@ def test_validate_reports_structure_issues_without_preflight_warning(tmp_path: P
     assert "changelog structure issues detected; release commands may fail." not in result.output
 
 
-def test_validate_rejects_unknown_entry_metadata_key(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_rejects_unknown_entry_metadata_key(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "unreleased" / "bad-co-authors.md").write_text(
@@ -6323,8 +6259,7 @@ def test_validate_rejects_unknown_entry_metadata_key(tmp_path: Path) -> None:
     assert "Unknown metadata key(s) 'co-authors'" in result.output
 
 
-def test_validate_rejects_invalid_pr_metadata_type(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_rejects_invalid_pr_metadata_type(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "unreleased" / "bad-pr.md").write_text(
@@ -6338,8 +6273,7 @@ def test_validate_rejects_invalid_pr_metadata_type(tmp_path: Path) -> None:
     assert "metadata.prs[0]: 'nope' is not valid under any of the given schemas" in result.output
 
 
-def test_validate_accepts_numeric_pr_string_metadata(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_accepts_numeric_pr_string_metadata(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "unreleased" / "string-pr.md").write_text(
@@ -6352,8 +6286,9 @@ def test_validate_accepts_numeric_pr_string_metadata(tmp_path: Path) -> None:
     assert result.exit_code == 0, result.output
 
 
-def test_validate_rejects_prs_metadata_when_omit_pr_configured(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_rejects_prs_metadata_when_omit_pr_configured(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6371,8 +6306,9 @@ def test_validate_rejects_prs_metadata_when_omit_pr_configured(tmp_path: Path) -
     assert "Entry has 'prs' metadata but the config sets 'omit_pr: true'" in result.output
 
 
-def test_validate_rejects_authors_metadata_when_omit_author_configured(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_rejects_authors_metadata_when_omit_author_configured(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6390,8 +6326,9 @@ def test_validate_rejects_authors_metadata_when_omit_author_configured(tmp_path:
     assert "Entry has 'authors' metadata but the config sets 'omit_author: true'" in result.output
 
 
-def test_validate_accepts_entries_without_prs_when_omit_pr_configured(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_accepts_entries_without_prs_when_omit_pr_configured(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6408,8 +6345,7 @@ def test_validate_accepts_entries_without_prs_when_omit_pr_configured(tmp_path:
     assert result.exit_code == 0, result.output
 
 
-def test_validate_requires_pr_when_configured(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_requires_pr_when_configured(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6431,8 +6367,7 @@ def test_validate_requires_pr_when_configured(tmp_path: Path) -> None:
     assert "prs: [1234]" in result.output
 
 
-def test_validate_accepts_pr_when_required(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_accepts_pr_when_required(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6451,8 +6386,7 @@ def test_validate_accepts_pr_when_required(tmp_path: Path) -> None:
     assert result.exit_code == 0, result.output
 
 
-def test_validate_require_pr_ignores_released_history(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_require_pr_ignores_released_history(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6476,8 +6410,7 @@ def test_validate_require_pr_ignores_released_history(tmp_path: Path) -> None:
     assert result.exit_code == 0, result.output
 
 
-def test_validate_does_not_require_pr_by_default(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_does_not_require_pr_by_default(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     write_entry(
@@ -6492,8 +6425,7 @@ def test_validate_does_not_require_pr_by_default(tmp_path: Path) -> None:
     assert result.exit_code == 0, result.output
 
 
-def test_validate_lenient_demotes_missing_pr_issues(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_lenient_demotes_missing_pr_issues(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6516,8 +6448,7 @@ def test_validate_lenient_demotes_missing_pr_issues(tmp_path: Path) -> None:
     assert "validation passed with 1 warning(s)" in plain_output
 
 
-def test_validate_lenient_keeps_non_pr_errors_fatal(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_lenient_keeps_non_pr_errors_fatal(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     save_config(
@@ -6539,8 +6470,7 @@ def test_validate_lenient_keeps_non_pr_errors_fatal(tmp_path: Path) -> None:
     assert "metadata.type" in plain_output or "Unknown type" in plain_output
 
 
-def test_validate_lenient_noops_without_require_pr(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_lenient_noops_without_require_pr(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     write_entry(
@@ -6577,8 +6507,24 @@ def test_validate_entry_skips_missing_pr_when_config_is_contradictory(tmp_path:
     assert all("missing PR reference" not in issue.message for issue in issues)
 
 
-def test_validate_rejects_invalid_entry_metadata_shapes(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_entry_reports_unknown_components_in_entry_order(tmp_path: Path) -> None:
+    project_dir = tmp_path / "project"
+    _bootstrap_changelog_project(project_dir)
+    path = write_entry(
+        project_dir,
+        {"title": "Components", "type": "feature", "components": ["zeta", "cli", "alpha"]},
+        body="Body.",
+        default_project="project",
+    )
+    entry = read_entry(path)
+    config = Config(id="project", name="Project", components={"cli": "CLI", "docs": "Docs"})
+
+    messages = [issue.message for issue in validate_entry(entry, config)]
+
+    assert messages == ["Unknown component(s) 'zeta', 'alpha'. Allowed components: cli, docs"]
+
+
+def test_validate_rejects_invalid_entry_metadata_shapes(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "unreleased" / "bad-shapes.md").write_text(
@@ -6610,8 +6556,9 @@ def test_validate_rejects_invalid_entry_metadata_shapes(tmp_path: Path) -> None:
     assert "metadata.project: ['project'] is not of type 'string'" in result.output
 
 
-def test_show_handles_invalid_author_metadata_without_crashing(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_show_handles_invalid_author_metadata_without_crashing(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     (project_dir / "unreleased" / "bad-author.md").write_text(
@@ -6625,8 +6572,9 @@ def test_show_handles_invalid_author_metadata_without_crashing(tmp_path: Path) -
     assert "@codex, @7" in click.utils.strip_ansi(result.output)
 
 
-def test_validate_rejects_invalid_released_entry_metadata(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_rejects_invalid_released_entry_metadata(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     release_dir = project_dir / "releases" / "v1.0.0"
@@ -6648,8 +6596,9 @@ def test_validate_rejects_invalid_released_entry_metadata(tmp_path: Path) -> Non
     assert "metadata.prs[0]: 'nope' is not valid under any of the given schemas" in result.output
 
 
-def test_validate_rejects_invalid_release_manifest_schema(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_rejects_invalid_release_manifest_schema(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
     release_dir = project_dir / "releases" / "v1.0.0"
@@ -6666,8 +6615,9 @@ def test_validate_rejects_invalid_release_manifest_schema(tmp_path: Path) -> Non
     assert "manifest.modules.plugin: False is not of type 'string'" in result.output
 
 
-def test_release_create_release_candidate_keeps_unreleased_entries(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_release_candidate_keeps_unreleased_entries(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6695,15 +6645,16 @@ def test_release_create_release_candidate_keeps_unreleased_entries(tmp_path: Pat
     )
     assert release_result.exit_code == 0, release_result.output
 
-    unreleased_entries = list((project_dir / "unreleased").glob("*.md"))
+    unreleased_entries = list_entry_files(project_dir / "unreleased")
     assert len(unreleased_entries) == 1
     assert (
         project_dir / "releases" / "v1.2.3-rc.1" / "entries" / unreleased_entries[0].name
     ).exists()
 
 
-def test_release_create_implicit_release_candidate_uses_auto_base(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_implicit_release_candidate_uses_auto_base(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6736,8 +6687,8 @@ def test_release_create_implicit_release_candidate_uses_auto_base(tmp_path: Path
 
 def test_release_create_implicit_release_candidate_increments_existing_series(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6799,15 +6750,15 @@ def test_release_create_implicit_release_candidate_increments_existing_series(
     assert rc2_result.stdout.strip() == "v0.1.0-rc.2"
 
     rc2_entries = {
-        path.stem for path in (project_dir / "releases" / "v0.1.0-rc.2" / "entries").glob("*.md")
+        path.stem for path in list_entry_files(project_dir / "releases" / "v0.1.0-rc.2" / "entries")
     }
     assert rc2_entries == {"first-rc-feature", "second-rc-fix"}
 
 
 def test_release_create_release_candidate_with_manual_bump_uses_requested_base(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6876,8 +6827,9 @@ def test_release_create_release_candidate_with_manual_bump_uses_requested_base(
     assert rc_result.stdout.strip() == "v1.3.0-rc.1"
 
 
-def test_release_create_rejects_explicit_prerelease_when_rc_flag_is_set(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_rejects_explicit_prerelease_when_rc_flag_is_set(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6915,8 +6867,9 @@ def test_release_create_rejects_explicit_prerelease_when_rc_flag_is_set(tmp_path
     assert "Use --rc with a stable base version like 1.2.3" in release_result.output
 
 
-def test_release_create_rejects_explicit_prerelease_without_rc_flag(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_rejects_explicit_prerelease_without_rc_flag(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -6953,8 +6906,9 @@ def test_release_create_rejects_explicit_prerelease_without_rc_flag(tmp_path: Pa
     assert "Release candidate versions must be created with --rc" in release_result.output
 
 
-def test_release_create_without_version_continues_outstanding_rc_series(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_without_version_continues_outstanding_rc_series(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7030,8 +6984,8 @@ def test_release_create_without_version_continues_outstanding_rc_series(tmp_path
 
 def test_release_create_rejects_promoting_release_candidate_when_unreleased_entry_diverged(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7088,8 +7042,9 @@ def test_release_create_rejects_promoting_release_candidate_when_unreleased_entr
     assert not (project_dir / "releases" / "v1.2.3").exists()
 
 
-def test_release_create_promotes_release_candidate_to_stable(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_promotes_release_candidate_to_stable(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7128,7 +7083,7 @@ def test_release_create_promotes_release_candidate_to_stable(tmp_path: Path) ->
         ],
     )
     assert promote_result.exit_code == 0, promote_result.output
-    assert not any((project_dir / "unreleased").glob("*.md"))
+    assert not list_entry_files(project_dir / "unreleased")
     assert (project_dir / "releases" / "v1.2.3" / "entries" / "rc-feature.md").exists()
     assert not (project_dir / "releases" / "v1.2.3-rc.1").exists()
 
@@ -7148,8 +7103,9 @@ def test_release_create_promotes_release_candidate_to_stable(tmp_path: Path) ->
     assert "v1.2.3-rc.1" not in show_result.output
 
 
-def test_release_create_explicit_stable_closes_active_rc_cycle(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_explicit_stable_closes_active_rc_cycle(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7203,10 +7159,10 @@ def test_release_create_explicit_stable_closes_active_rc_cycle(tmp_path: Path) -
     assert stable_result.exit_code == 0, stable_result.output
     assert (project_dir / "releases" / "v1.3.0" / "entries" / "rc-feature.md").exists()
     assert not (project_dir / "releases" / "v1.2.3-rc.1").exists()
-    assert not any((project_dir / "unreleased").glob("*.md"))
+    assert not list_entry_files(project_dir / "unreleased")
 
-    manifest_data = yaml.safe_load(
-        (project_dir / "releases" / "v1.3.0" / "manifest.yaml").read_text(encoding="utf-8")
+    manifest_data = load_release_manifest_data(
+        project_dir / "releases" / "v1.3.0" / "manifest.yaml"
     )
     assert manifest_data["title"] == "Curated RC title"
     assert manifest_data["intro"] == "Curated RC intro."
@@ -7217,8 +7173,9 @@ def test_release_create_explicit_stable_closes_active_rc_cycle(tmp_path: Path) -
     )
 
 
-def test_release_create_continuing_rc_preserves_previous_intro(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_continuing_rc_preserves_previous_intro(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7265,15 +7222,15 @@ def test_release_create_continuing_rc_preserves_previous_intro(tmp_path: Path) -
     assert not (project_dir / "releases" / "v1.2.3-rc.1").exists()
     rc2_dir = project_dir / "releases" / "v1.2.3-rc.2"
     assert rc2_dir.exists()
-    manifest_data = yaml.safe_load((rc2_dir / "manifest.yaml").read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(rc2_dir / "manifest.yaml")
     assert manifest_data["intro"] == "Custom intro."
     assert (rc2_dir / "notes.md").read_text(encoding="utf-8").startswith("Custom intro.")
 
 
 def test_release_create_explicit_matching_active_rc_requires_implicit_promotion(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7329,8 +7286,9 @@ def test_release_create_explicit_matching_active_rc_requires_implicit_promotion(
     assert (project_dir / "releases" / "v1.2.3-rc.1").exists()
 
 
-def test_release_create_ignores_closed_release_candidate_history(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_ignores_closed_release_candidate_history(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7385,8 +7343,8 @@ def test_release_create_ignores_closed_release_candidate_history(tmp_path: Path)
 
 def test_collect_unused_entries_for_release_filters_only_outstanding_candidates(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7442,8 +7400,8 @@ def test_collect_unused_entries_for_release_filters_only_outstanding_candidates(
 
 def test_collect_unused_entries_for_release_ignores_non_stable_legacy_prereleases(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7480,8 +7438,8 @@ def test_collect_unused_entries_for_release_ignores_non_stable_legacy_prerelease
 
 def test_release_create_warns_when_promoted_entries_are_missing_from_unreleased(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7530,8 +7488,8 @@ def test_release_create_warns_when_promoted_entries_are_missing_from_unreleased(
 
 def test_release_create_promotion_folds_in_unreleased_entries_added_after_rc(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7591,18 +7549,19 @@ def test_release_create_promotion_folds_in_unreleased_entries_added_after_rc(
     assert "folded 1 unreleased entry added after v1.2.3-rc.1" in promote_result.stderr
 
     release_dir = project_dir / "releases" / "v1.2.3"
-    release_entries = {path.stem for path in (release_dir / "entries").glob("*.md")}
+    release_entries = {path.stem for path in list_entry_files(release_dir / "entries")}
     assert release_entries == {"rc-feature", "late-bugfix"}
     assert not (project_dir / "releases" / "v1.2.3-rc.1").exists()
-    assert not any((project_dir / "unreleased").glob("*.md"))
+    assert not list_entry_files(project_dir / "unreleased")
 
     notes = (release_dir / "notes.md").read_text(encoding="utf-8")
     assert "Snapshot me." in notes
     assert "Merged after the last candidate." in notes
 
 
-def test_release_create_promotion_folds_entries_across_rc_series(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_promotion_folds_entries_across_rc_series(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7653,20 +7612,21 @@ def test_release_create_promotion_folds_entries_across_rc_series(tmp_path: Path)
     assert promote_result.exit_code == 0, promote_result.output
 
     release_entries = {
-        path.stem for path in (project_dir / "releases" / "v1.2.3" / "entries").glob("*.md")
+        path.stem for path in list_entry_files(project_dir / "releases" / "v1.2.3" / "entries")
     }
     assert release_entries == {
         "first-rc-feature",
         "second-rc-feature",
         "late-bugfix",
     }
-    assert not any((project_dir / "unreleased").glob("*.md"))
+    assert not list_entry_files(project_dir / "unreleased")
     assert not (project_dir / "releases" / "v1.2.3-rc.1").exists()
     assert not (project_dir / "releases" / "v1.2.3-rc.2").exists()
 
 
-def test_release_create_sequential_release_candidates_include_new_entries(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_sequential_release_candidates_include_new_entries(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7719,15 +7679,15 @@ def test_release_create_sequential_release_candidates_include_new_entries(tmp_pa
     assert rc2_result.exit_code == 0, rc2_result.output
 
     rc2_entries = {
-        path.stem for path in (project_dir / "releases" / "v1.2.3-rc.2" / "entries").glob("*.md")
+        path.stem for path in list_entry_files(project_dir / "releases" / "v1.2.3-rc.2" / "entries")
     }
     assert rc2_entries == {"first-rc-feature", "second-rc-feature"}
 
 
 def test_release_create_without_rc_promotes_latest_outstanding_candidate(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7799,13 +7759,13 @@ def test_release_create_without_rc_promotes_latest_outstanding_candidate(
     assert result.exit_code == 0, result.output
     assert (project_dir / "releases" / "v2.0.0").exists()
     assert not (project_dir / "releases" / "v1.6.0").exists()
-    assert not any((project_dir / "unreleased").glob("*.md"))
+    assert not list_entry_files(project_dir / "unreleased")
 
 
 def test_release_create_patch_bump_uses_release_candidate_base_when_no_stable_exists(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7844,8 +7804,8 @@ def test_release_create_patch_bump_uses_release_candidate_base_when_no_stable_ex
 
 def test_release_create_patch_bump_rejects_versions_at_or_below_active_rc_target(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7911,8 +7871,8 @@ def test_release_create_patch_bump_rejects_versions_at_or_below_active_rc_target
 
 def test_release_create_explicit_stable_rejects_versions_older_than_active_rc_target(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -7976,8 +7936,9 @@ def test_release_create_explicit_stable_rejects_versions_older_than_active_rc_ta
     assert (project_dir / "unreleased" / "preview-feature.md").exists()
 
 
-def test_release_create_major_bump_closing_active_rc_preserves_metadata(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_major_bump_closing_active_rc_preserves_metadata(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8050,17 +8011,16 @@ def test_release_create_major_bump_closing_active_rc_preserves_metadata(tmp_path
     release_dir = project_dir / "releases" / "v2.0.0"
     assert (release_dir / "entries" / "preview-feature.md").exists()
     assert not (project_dir / "releases" / "v1.3.0-rc.1").exists()
-    assert not any((project_dir / "unreleased").glob("*.md"))
+    assert not list_entry_files(project_dir / "unreleased")
 
-    manifest_data = yaml.safe_load((release_dir / "manifest.yaml").read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(release_dir / "manifest.yaml")
     assert manifest_data["title"] == "Curated RC title"
     assert manifest_data["intro"] == "Curated RC intro."
     assert (release_dir / "notes.md").read_text(encoding="utf-8").startswith("Curated RC intro.")
 
 
-def test_release_version_command(tmp_path: Path) -> None:
+def test_release_version_command(tmp_path: Path, runner: CliRunner) -> None:
     """Test the release version command outputs the latest stable version."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8110,8 +8070,7 @@ def test_release_version_command(tmp_path: Path) -> None:
     assert version_result.stdout.strip() == "v2.0.0"
 
 
-def test_release_version_ignores_release_candidates(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_version_ignores_release_candidates(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8183,8 +8142,7 @@ def test_release_version_ignores_release_candidates(tmp_path: Path) -> None:
     assert version_result.stdout.strip() == "v1.5.0"
 
 
-def test_show_latest_ignores_release_candidates(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_show_latest_ignores_release_candidates(tmp_path: Path, runner: CliRunner) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8260,8 +8218,9 @@ def test_show_latest_ignores_release_candidates(tmp_path: Path) -> None:
     assert "v1.5.0" in show_result.output
 
 
-def test_show_release_uses_manifest_specific_entry_snapshots(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_show_release_uses_manifest_specific_entry_snapshots(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8283,7 +8242,7 @@ def test_show_release_uses_manifest_specific_entry_snapshots(tmp_path: Path) ->
     )
     assert add_result.exit_code == 0, add_result.output
 
-    entry_path = next((project_dir / "unreleased").glob("*.md"))
+    entry_path = list_entry_files(project_dir / "unreleased")[0]
 
     rc_release = runner.invoke(
         cli,
@@ -8411,8 +8370,9 @@ def test_show_release_uses_manifest_specific_entry_snapshots(tmp_path: Path) ->
     assert deleted_rc2_markdown.exit_code != 0
 
 
-def test_release_create_edit_existing_stable_ignores_rc_snapshots(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_release_create_edit_existing_stable_ignores_rc_snapshots(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8487,7 +8447,7 @@ def test_release_create_edit_existing_stable_ignores_rc_snapshots(tmp_path: Path
     assert edit_release.exit_code == 0, edit_release.output
 
     release_entries = {
-        path.stem for path in (project_dir / "releases" / "v1.5.0" / "entries").glob("*.md")
+        path.stem for path in list_entry_files(project_dir / "releases" / "v1.5.0" / "entries")
     }
     assert release_entries == {"stable-feature"}
 
@@ -8497,9 +8457,8 @@ def test_release_create_edit_existing_stable_ignores_rc_snapshots(tmp_path: Path
     assert "Preview Feature" not in stable_notes
 
 
-def test_release_version_bare_flag(tmp_path: Path) -> None:
+def test_release_version_bare_flag(tmp_path: Path, runner: CliRunner) -> None:
     """Test the release version --bare flag strips the v prefix."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8548,9 +8507,8 @@ def test_release_version_bare_flag(tmp_path: Path) -> None:
     assert version_result.stdout.strip() == "3.1.4"
 
 
-def test_release_version_no_releases(tmp_path: Path) -> None:
+def test_release_version_no_releases(tmp_path: Path, runner: CliRunner) -> None:
     """Test the release version command fails when no releases exist."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8588,10 +8546,9 @@ def test_release_version_no_releases(tmp_path: Path) -> None:
 
 
 def test_release_publish_defaults_to_latest_release(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
     """Test that release publish without version uses the latest release."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8653,7 +8610,7 @@ def test_release_publish_defaults_to_latest_release(
 
     # Set up a config with repository so publish doesn't complain about missing repo.
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = "owner/repo"
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -8696,9 +8653,8 @@ def test_release_publish_defaults_to_latest_release(
 
 
 def test_release_publish_defaults_to_latest_release_when_only_rc_exists(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8727,7 +8683,7 @@ def test_release_publish_defaults_to_latest_release_when_only_rc_exists(
     assert release_result.exit_code == 0, release_result.output
 
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = "owner/repo"
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -8765,9 +8721,8 @@ def test_release_publish_defaults_to_latest_release_when_only_rc_exists(
 
 
 def test_release_publish_infers_prerelease_and_not_latest(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8796,7 +8751,7 @@ def test_release_publish_infers_prerelease_and_not_latest(
     assert release_result.exit_code == 0, release_result.output
 
     config_path = project_dir / "config.yaml"
-    config_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_data = load_yaml(config_path.read_bytes())
     config_data["repository"] = "owner/repo"
     config_path.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
 
@@ -8833,9 +8788,8 @@ def test_release_publish_infers_prerelease_and_not_latest(
     assert "--latest=false" in recorded_args
 
 
-def test_add_omit_pr_config(tmp_path: Path) -> None:
+def test_add_omit_pr_config(tmp_path: Path, runner: CliRunner) -> None:
     """Test that omit_pr config prevents PR from being auto-detected or added."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8884,16 +8838,15 @@ def test_add_omit_pr_config(tmp_path: Path) -> None:
 
     # Verify entry has no PR field
     entries_dir = project_dir / "unreleased"
-    entry_files = list(entries_dir.glob("*.md"))
+    entry_files = list_entry_files(entries_dir)
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     assert "pr" not in entry.metadata
     assert "prs" not in entry.metadata
 
 
-def test_add_omit_pr_config_warns_on_explicit_pr(tmp_path: Path) -> None:
+def test_add_omit_pr_config_warns_on_explicit_pr(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --pr emits warning when omit_pr is configured."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -8924,7 +8877,7 @@ def test_add_omit_pr_config_warns_on_explicit_pr(tmp_path: Path) -> None:
 
     # Verify entry has no PR field despite explicit --pr
     entries_dir = project_dir / "unreleased"
-    entry_files = list(entries_dir.glob("*.md"))
+    entry_files = list_entry_files(entries_dir)
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     assert "pr" not in entry.metadata
@@ -8932,9 +8885,8 @@ def test_add_omit_pr_config_warns_on_explicit_pr(tmp_path: Path) -> None:
 
 
 def test_add_warns_when_required_pr_is_missing(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     save_config(
@@ -8968,9 +8920,8 @@ def test_add_warns_when_required_pr_is_missing(
 
 
 def test_add_does_not_warn_when_required_pr_is_recorded(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     save_config(
@@ -9005,9 +8956,8 @@ def test_add_does_not_warn_when_required_pr_is_recorded(
     assert "prs: [<number>]" not in add_result.output
 
 
-def test_add_omit_author_config(tmp_path: Path) -> None:
+def test_add_omit_author_config(tmp_path: Path, runner: CliRunner) -> None:
     """Test that omit_author config prevents author from being auto-detected or added."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -9038,16 +8988,15 @@ def test_add_omit_author_config(tmp_path: Path) -> None:
 
     # Verify entry has no author field
     entries_dir = project_dir / "unreleased"
-    entry_files = list(entries_dir.glob("*.md"))
+    entry_files = list_entry_files(entries_dir)
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     assert "author" not in entry.metadata
     assert "authors" not in entry.metadata
 
 
-def test_add_omit_author_config_warns_on_explicit_author(tmp_path: Path) -> None:
+def test_add_omit_author_config_warns_on_explicit_author(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --author emits warning when omit_author is configured."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -9076,16 +9025,15 @@ def test_add_omit_author_config_warns_on_explicit_author(tmp_path: Path) -> None
 
     # Verify entry has no author field despite explicit --author
     entries_dir = project_dir / "unreleased"
-    entry_files = list(entries_dir.glob("*.md"))
+    entry_files = list_entry_files(entries_dir)
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     assert "author" not in entry.metadata
     assert "authors" not in entry.metadata
 
 
-def test_add_omit_author_config_warns_on_co_author(tmp_path: Path) -> None:
+def test_add_omit_author_config_warns_on_co_author(tmp_path: Path, runner: CliRunner) -> None:
     """Test that --co-author emits warning when omit_author is configured."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -9114,16 +9062,15 @@ def test_add_omit_author_config_warns_on_co_author(tmp_path: Path) -> None:
 
     # Verify entry has no author field despite explicit --co-author
     entries_dir = project_dir / "unreleased"
-    entry_files = list(entries_dir.glob("*.md"))
+    entry_files = list_entry_files(entries_dir)
     assert len(entry_files) == 1
     entry = read_entry(entry_files[0])
     assert "author" not in entry.metadata
     assert "authors" not in entry.metadata
 
 
-def test_show_version_case_insensitive(tmp_path: Path) -> None:
+def test_show_version_case_insensitive(tmp_path: Path, runner: CliRunner) -> None:
     """Test that show command handles version identifiers case-insensitively."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
@@ -9195,9 +9142,8 @@ def test_show_version_case_insensitive(tmp_path: Path) -> None:
     assert "Case Test Feature" in markdown_result.output
 
 
-def test_entry_ids_are_scoped_to_each_release(tmp_path: Path) -> None:
+def test_entry_ids_are_scoped_to_each_release(tmp_path: Path, runner: CliRunner) -> None:
     """Historical ID reuse stays releasable, visible, valid, and countable."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     project_dir.mkdir()
     entry_id = "dependency-compatibility-updates"
@@ -9270,7 +9216,7 @@ def test_entry_ids_are_scoped_to_each_release(tmp_path: Path) -> None:
         ],
     )
     assert show_json.exit_code == 0, show_json.output
-    payload = json.loads(show_json.output)
+    payload = json.loads(show_json.stdout_bytes)
     assert [entry["release"] for entry in payload["entries"]] == [
         None,
         "v3.0.1",
@@ -9282,7 +9228,7 @@ def test_entry_ids_are_scoped_to_each_release(tmp_path: Path) -> None:
         ["--root", str(project_dir), "show", "unreleased", entry_id, "-j"],
     )
     assert unreleased_json.exit_code == 0, unreleased_json.output
-    payload = json.loads(unreleased_json.output)
+    payload = json.loads(unreleased_json.stdout_bytes)
     assert [entry["release"] for entry in payload["entries"]] == [None]
 
     show_markdown = runner.invoke(
@@ -9325,14 +9271,15 @@ def test_entry_ids_are_scoped_to_each_release(tmp_path: Path) -> None:
 
     stats = runner.invoke(cli, ["--root", str(project_dir), "stats", "--json"])
     assert stats.exit_code == 0, stats.output
-    stats_payload = json.loads(stats.output)
+    stats_payload = json.loads(stats.stdout_bytes)
     assert stats_payload["parent"]["entries"]["shipped"] == 2
     assert stats_payload["parent"]["entries"]["unreleased"] == 1
     assert stats_payload["parent"]["entries"]["total"] == 3
 
 
-def test_validate_resolves_manifest_entries_within_their_release(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_resolves_manifest_entries_within_their_release(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
 
@@ -9365,8 +9312,9 @@ def test_validate_resolves_manifest_entries_within_their_release(tmp_path: Path)
     assert "Release references missing entry id 'shared-id'" in result.output
 
 
-def test_validate_rejects_duplicate_ids_within_one_manifest(tmp_path: Path) -> None:
-    runner = CliRunner()
+def test_validate_rejects_duplicate_ids_within_one_manifest(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     project_dir = tmp_path / "project"
     _bootstrap_changelog_project(project_dir)
 
@@ -9415,10 +9363,9 @@ def test_release_progress_style_matches_outcome(monkeypatch: pytest.MonkeyPatch)
 
 
 def test_release_publish_no_github_release_pushes_tag_without_gh(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
     """--no-github-release pushes the tag without invoking or requiring gh."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner)
 
@@ -9472,9 +9419,8 @@ def test_release_publish_no_github_release_pushes_tag_without_gh(
     assert "skipped creating a GitHub release" in result.output
 
 
-def test_release_publish_no_github_release_requires_tag(tmp_path: Path) -> None:
+def test_release_publish_no_github_release_requires_tag(tmp_path: Path, runner: CliRunner) -> None:
     """The skipped-release mode must not succeed without a publish step."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner)
 
@@ -9496,10 +9442,9 @@ def test_release_publish_no_github_release_requires_tag(tmp_path: Path) -> None:
 
 
 def test_release_publish_still_creates_release_by_default(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
     """Omitting the flag keeps the previous behaviour."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner)
 
@@ -9525,10 +9470,9 @@ def test_release_publish_still_creates_release_by_default(
 
 
 def test_release_publish_declining_aborts_before_any_git_mutation(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
     """Declining must happen before the commit and tag reach the remote."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner)
 
@@ -9563,10 +9507,9 @@ def test_release_publish_declining_aborts_before_any_git_mutation(
 
 
 def test_release_publish_no_github_release_still_confirms(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
     """--yes must stay meaningful in tag-only mode."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner)
 
@@ -9602,10 +9545,9 @@ def test_release_publish_no_github_release_still_confirms(
 
 
 def test_release_publish_prompt_shows_edit_for_existing_release(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
 ) -> None:
     """The prompt must name the operation that will actually run."""
-    runner = CliRunner()
     project_dir = tmp_path / "project"
     _setup_publishable_release(project_dir, runner)
 
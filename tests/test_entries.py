@@ -7,7 +7,13 @@ from pathlib import Path
 
 import pytest
 
-from tenzir_ship.entries import iter_entries, read_entry, sort_entries_desc, write_entry
+from tenzir_ship.entries import (
+    iter_entries,
+    list_entry_files,
+    read_entry,
+    sort_entries_desc,
+    write_entry,
+)
 
 
 def test_sort_entries_desc_orders_by_created_datetime(tmp_path: Path) -> None:
@@ -114,3 +120,95 @@ def test_read_entry_preserves_plural_components(tmp_path: Path) -> None:
 
     assert entry.metadata["components"] == ["cli", "api"]
     assert entry.components == ["cli", "api"]
+
+
+def test_read_entry_normalizes_crlf_line_endings(tmp_path: Path) -> None:
+    entry_file = tmp_path / "test.md"
+    entry_file.write_bytes(
+        b"---\r\ntitle: Test Entry\r\ntype: feature\r\n---\r\n\r\nFirst line.\r\nSecond line.\r\n"
+    )
+
+    entry = read_entry(entry_file)
+
+    assert entry.metadata == {"title": "Test Entry", "type": "feature"}
+    assert entry.body == "First line.\nSecond line."
+
+
+def test_read_entry_accepts_empty_frontmatter(tmp_path: Path) -> None:
+    entry_file = tmp_path / "empty.md"
+    entry_file.write_text("---\n\n---\nBody text.\n", encoding="utf-8")
+
+    entry = read_entry(entry_file)
+
+    assert entry.metadata == {}
+    assert entry.body == "Body text."
+
+
+def test_write_entry_rejects_existing_entry_id(tmp_path: Path) -> None:
+    path = write_entry(tmp_path, {"title": "Duplicate", "type": "change"}, "Original body")
+
+    with pytest.raises(ValueError, match="already exists"):
+        write_entry(tmp_path, {"title": "Duplicate", "type": "change"}, "Replacement body")
+
+    assert read_entry(path).body == "Original body"
+
+
+def test_list_entry_files_returns_sorted_markdown_files(tmp_path: Path) -> None:
+    """Only Markdown files are listed, in name order; missing dirs are empty."""
+    assert list_entry_files(tmp_path / "missing") == []
+    for name in ("b-entry.md", "a-entry.md", ".gitkeep", "notes.txt"):
+        (tmp_path / name).write_text("", encoding="utf-8")
+
+    assert list_entry_files(tmp_path) == [tmp_path / "a-entry.md", tmp_path / "b-entry.md"]
+
+
+@pytest.mark.parametrize(
+    ("frontmatter", "expected"),
+    [
+        pytest.param(
+            "title: Exciting Feature\ntype: feature\nauthors:\n  - octocat\nprs:\n  - 42\n"
+            "created: 2024-05-06T07:08:09.5Z\n",
+            {
+                "title": "Exciting Feature",
+                "type": "feature",
+                "authors": ["octocat"],
+                "prs": [42],
+                "created": datetime(2024, 5, 6, 7, 8, 9, 500000, tzinfo=timezone.utc),
+            },
+            id="written-subset",
+        ),
+        pytest.param(
+            "title: 'Fix: quoted # title'\ntype: bugfix\nprs:\n- '007'\n",
+            {"title": "Fix: quoted # title", "type": "bugfix", "prs": ["007"]},
+            id="quoted-scalars",
+        ),
+        pytest.param(
+            "title: Wrapped\n  title text\ntype: change\nauthors:\n  - yes\n",
+            {"title": "Wrapped title text", "type": "change", "authors": [True]},
+            id="yaml-only-syntax",
+        ),
+        *(
+            pytest.param(
+                f"type: change\n{key}: flag\n",
+                {"type": "change", value: "flag"},
+                id=f"reserved-key-{key}",
+            )
+            for key, value in (
+                ("on", True),
+                ("yes", True),
+                ("true", True),
+                ("no", False),
+                ("off", False),
+                ("false", False),
+                ("null", None),
+            )
+        ),
+    ],
+)
+def test_read_entry_frontmatter_matches_yaml(
+    tmp_path: Path, frontmatter: str, expected: dict[object, object]
+) -> None:
+    entry_file = tmp_path / "entry.md"
+    entry_file.write_text(f"---\n{frontmatter}---\n\nBody.\n", encoding="utf-8")
+
+    assert read_entry(entry_file).metadata == expected
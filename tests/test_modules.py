@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
 from tenzir_ship.cli import cli
 from tenzir_ship.config import Config
-from tenzir_ship.modules import discover_modules, discover_modules_from_config
+import tenzir_ship.validate as validate_module
+from tenzir_ship.modules import Module, discover_modules, discover_modules_from_config
+from tenzir_ship.releases import load_release_manifest_data
 from tenzir_ship.validate import validate_modules, run_validation_with_modules
 
 
@@ -202,12 +205,49 @@ def test_run_validation_with_modules_prefixes_issues(tmp_path: Path) -> None:
     assert "Missing type" in module_issues[0].message
 
 
+def test_run_validation_with_modules_validates_shared_roots_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Modules resolving to the same root are traversed once but reported per module."""
+    packages = tmp_path / "packages"
+    mod_root = create_module(packages, "mymod", "My Module")
+    (mod_root / "unreleased" / "bad-entry.md").write_text(
+        "---\ntitle: Bad Entry\ncreated: 2025-01-01T00:00:00Z\n---\n\nBody.\n",
+        encoding="utf-8",
+    )
+    alias = tmp_path / "alias"
+    alias.symlink_to(mod_root, target_is_directory=True)
+
+    parent_root = tmp_path / "changelog"
+    parent_root.mkdir()
+    (parent_root / "unreleased").mkdir()
+    config = Config(id="parent", name="Parent")
+    module = discover_modules_from_config(
+        parent_root, Config(id="parent", name="Parent", modules="../packages/*/changelog")
+    )[0]
+    modules = [module, Module(root=alias, config=module.config, relative_path="../alias")]
+
+    validated_roots: list[Path] = []
+    original_run_validation = validate_module.run_validation
+
+    def _counting_run_validation(project_root: Path, project_config: Config) -> list:
+        validated_roots.append(project_root)
+        return original_run_validation(project_root, project_config)
+
+    monkeypatch.setattr(validate_module, "run_validation", _counting_run_validation)
+
+    issues = run_validation_with_modules(parent_root, config, modules)
+
+    assert validated_roots == [parent_root, module.root]
+    missing_type = [i for i in issues if i.message == "[mymod] Missing type"]
+    assert len(missing_type) == 2
+
+
 # --- CLI Tests ---
 
 
-def test_cli_stats_command_shows_parent(tmp_path: Path) -> None:
+def test_cli_stats_command_shows_parent(tmp_path: Path, runner: CliRunner) -> None:
     """stats command shows parent project even without modules."""
-    runner = CliRunner()
     project_dir = tmp_path / "changelog"
     project_dir.mkdir()
     write_yaml(project_dir / "config.yaml", {"id": "test", "name": "Test"})
@@ -219,7 +259,7 @@ def test_cli_stats_command_shows_parent(tmp_path: Path) -> None:
     assert "📛" in result.output  # vertical view shows project info
 
 
-def test_cli_stats_command_lists_modules(tmp_path: Path) -> None:
+def test_cli_stats_command_lists_modules(tmp_path: Path, runner: CliRunner) -> None:
     """stats command lists discovered modules with their IDs."""
     packages = tmp_path / "packages"
     create_module(packages, "foo", "Foo Package")
@@ -233,7 +273,6 @@ def test_cli_stats_command_lists_modules(tmp_path: Path) -> None:
     )
     (project_dir / "unreleased").mkdir()
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--root", str(project_dir), "stats"])
 
     assert result.exit_code == 0
@@ -243,9 +282,8 @@ def test_cli_stats_command_lists_modules(tmp_path: Path) -> None:
     assert "bar" in result.output
 
 
-def test_cli_stats_vertical_view_for_single_project(tmp_path: Path) -> None:
+def test_cli_stats_vertical_view_for_single_project(tmp_path: Path, runner: CliRunner) -> None:
     """stats command uses vertical view for projects without modules."""
-    runner = CliRunner()
     project_dir = tmp_path / "changelog"
     project_dir.mkdir()
     write_yaml(project_dir / "config.yaml", {"id": "myproject", "name": "My Project"})
@@ -260,9 +298,8 @@ def test_cli_stats_vertical_view_for_single_project(tmp_path: Path) -> None:
     assert "🔖" in result.output  # Version row
 
 
-def test_cli_stats_table_flag_forces_table_view(tmp_path: Path) -> None:
+def test_cli_stats_table_flag_forces_table_view(tmp_path: Path, runner: CliRunner) -> None:
     """stats --table forces table view even for single project."""
-    runner = CliRunner()
     project_dir = tmp_path / "changelog"
     project_dir.mkdir()
     write_yaml(project_dir / "config.yaml", {"id": "myproject", "name": "My Project"})
@@ -277,11 +314,10 @@ def test_cli_stats_table_flag_forces_table_view(tmp_path: Path) -> None:
     assert "myproject" in result.output
 
 
-def test_cli_stats_json_output(tmp_path: Path) -> None:
+def test_cli_stats_json_output(tmp_path: Path, runner: CliRunner) -> None:
     """stats --json produces valid JSON output."""
     import json
 
-    runner = CliRunner()
     project_dir = tmp_path / "changelog"
     project_dir.mkdir()
     write_yaml(project_dir / "config.yaml", {"id": "myproject", "name": "My Project"})
@@ -298,7 +334,7 @@ def test_cli_stats_json_output(tmp_path: Path) -> None:
     assert "entries" in data["parent"]
 
 
-def test_cli_show_includes_modules_by_default(tmp_path: Path) -> None:
+def test_cli_show_includes_modules_by_default(tmp_path: Path, runner: CliRunner) -> None:
     """show command includes module entries by default."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -314,7 +350,6 @@ def test_cli_show_includes_modules_by_default(tmp_path: Path) -> None:
     # Create parent entry
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--root", str(project_dir), "show"])
 
     assert result.exit_code == 0
@@ -322,7 +357,7 @@ def test_cli_show_includes_modules_by_default(tmp_path: Path) -> None:
     assert "Parent Feature" in result.output
 
 
-def test_cli_show_preserves_reused_entry_ids_in_modules(tmp_path: Path) -> None:
+def test_cli_show_preserves_reused_entry_ids_in_modules(tmp_path: Path, runner: CliRunner) -> None:
     """Module history keeps one occurrence per release namespace."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -337,7 +372,6 @@ def test_cli_show_preserves_reused_entry_ids_in_modules(tmp_path: Path) -> None:
     )
     (project_dir / "unreleased").mkdir()
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--root", str(project_dir), "show"])
 
     assert result.exit_code == 0, result.output
@@ -346,7 +380,7 @@ def test_cli_show_preserves_reused_entry_ids_in_modules(tmp_path: Path) -> None:
     assert "v1.1.0" in result.output
 
 
-def test_cli_validate_with_modules(tmp_path: Path) -> None:
+def test_cli_validate_with_modules(tmp_path: Path, runner: CliRunner) -> None:
     """validate command checks parent and modules."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -361,14 +395,15 @@ def test_cli_validate_with_modules(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Entry")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--root", str(project_dir), "validate"])
 
     assert result.exit_code == 0
     assert "all changelog files look good" in result.output
 
 
-def test_cli_validate_with_modules_demotes_missing_pr_in_lenient_mode(tmp_path: Path) -> None:
+def test_cli_validate_with_modules_demotes_missing_pr_in_lenient_mode(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     """validate --lenient demotes module missing-PR issues."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -386,7 +421,6 @@ def test_cli_validate_with_modules_demotes_missing_pr_in_lenient_mode(tmp_path:
     )
     (project_dir / "unreleased").mkdir()
 
-    runner = CliRunner()
     strict_result = runner.invoke(cli, ["--root", str(project_dir), "validate"])
     lenient_result = runner.invoke(
         cli,
@@ -401,7 +435,7 @@ def test_cli_validate_with_modules_demotes_missing_pr_in_lenient_mode(tmp_path:
     assert "validation passed with 1 warning(s)" in lenient_result.output
 
 
-def test_show_warns_on_module_structure_violation(tmp_path: Path) -> None:
+def test_show_warns_on_module_structure_violation(tmp_path: Path, runner: CliRunner) -> None:
     """Non-release commands warn when module changelog layout is invalid."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -417,7 +451,6 @@ def test_show_warns_on_module_structure_violation(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Entry")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--root", str(project_dir), "show"])
 
     assert result.exit_code == 0, result.output
@@ -425,7 +458,9 @@ def test_show_warns_on_module_structure_violation(tmp_path: Path) -> None:
     assert "[mymod] Unexpected item in changelog root: 'next'" in result.output
 
 
-def test_release_create_fails_on_module_structure_violation(tmp_path: Path) -> None:
+def test_release_create_fails_on_module_structure_violation(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     """Release creation hard-fails when a module changelog layout is invalid."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -441,7 +476,6 @@ def test_release_create_fails_on_module_structure_violation(tmp_path: Path) -> N
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Entry")
 
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"],
@@ -481,14 +515,14 @@ def create_released_entry(
         )
     else:
         # Append entry to existing manifest
-        manifest = yaml.safe_load(manifest_path.read_text())
+        manifest = load_release_manifest_data(manifest_path)
         if slug not in manifest["entries"]:
             manifest["entries"].append(slug)
             write_yaml(manifest_path, manifest)
     return entry_path
 
 
-def test_show_release_includes_module_sections(tmp_path: Path) -> None:
+def test_show_release_includes_module_sections(tmp_path: Path, runner: CliRunner) -> None:
     """show --release includes module sections with released entries."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -504,7 +538,6 @@ def test_show_release_includes_module_sections(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["--root", str(project_dir), "show", "--release", "-m", "unreleased"]
     )
@@ -522,7 +555,7 @@ def test_show_release_includes_module_sections(tmp_path: Path) -> None:
     assert "---" in result.output
 
 
-def test_show_release_module_entries_are_compact(tmp_path: Path) -> None:
+def test_show_release_module_entries_are_compact(tmp_path: Path, runner: CliRunner) -> None:
     """Module entries show title and attribution, not body."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -537,7 +570,6 @@ def test_show_release_module_entries_are_compact(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["--root", str(project_dir), "show", "--release", "-m", "unreleased"]
     )
@@ -553,7 +585,7 @@ def test_show_release_module_entries_are_compact(tmp_path: Path) -> None:
     assert "Entry body text" not in lines
 
 
-def test_show_release_excludes_unreleased_module_entries(tmp_path: Path) -> None:
+def test_show_release_excludes_unreleased_module_entries(tmp_path: Path, runner: CliRunner) -> None:
     """Only released module entries are included, not unreleased."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -568,7 +600,6 @@ def test_show_release_excludes_unreleased_module_entries(tmp_path: Path) -> None
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["--root", str(project_dir), "show", "--release", "-m", "unreleased"]
     )
@@ -582,7 +613,9 @@ def test_show_release_excludes_unreleased_module_entries(tmp_path: Path) -> None
     assert "Unreleased Module Feature" not in result.output
 
 
-def test_release_create_from_release_candidate_preserves_module_snapshot(tmp_path: Path) -> None:
+def test_release_create_from_release_candidate_preserves_module_snapshot(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
     create_released_entry(mod_root, "Module Stable One", "v1.0.0", "feature")
@@ -596,7 +629,6 @@ def test_release_create_from_release_candidate_preserves_module_snapshot(tmp_pat
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     rc_result = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v2.0.0", "--rc", "--yes"],
@@ -617,8 +649,8 @@ def test_release_create_from_release_candidate_preserves_module_snapshot(tmp_pat
     )
     assert promote_result.exit_code == 0, promote_result.output
 
-    manifest_data = yaml.safe_load(
-        (project_dir / "releases" / "v2.0.0" / "manifest.yaml").read_text(encoding="utf-8")
+    manifest_data = load_release_manifest_data(
+        project_dir / "releases" / "v2.0.0" / "manifest.yaml"
     )
     assert manifest_data["modules"] == {"mymod": "v1.0.0"}
 
@@ -640,6 +672,7 @@ def test_release_create_from_release_candidate_preserves_module_snapshot(tmp_pat
 
 def test_release_create_from_release_candidate_preserves_empty_module_snapshot(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -654,7 +687,6 @@ def test_release_create_from_release_candidate_preserves_empty_module_snapshot(
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     rc_result = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v2.0.0", "--rc", "--yes"],
@@ -662,7 +694,7 @@ def test_release_create_from_release_candidate_preserves_empty_module_snapshot(
     assert rc_result.exit_code == 0, rc_result.output
 
     rc_manifest_path = project_dir / "releases" / "v2.0.0-rc.1" / "manifest.yaml"
-    rc_manifest_data = yaml.safe_load(rc_manifest_path.read_text(encoding="utf-8"))
+    rc_manifest_data = load_release_manifest_data(rc_manifest_path)
     rc_manifest_data["modules"] = {}
     rc_manifest_path.write_text(yaml.safe_dump(rc_manifest_data, sort_keys=False), encoding="utf-8")
 
@@ -680,8 +712,8 @@ def test_release_create_from_release_candidate_preserves_empty_module_snapshot(
     )
     assert promote_result.exit_code == 0, promote_result.output
 
-    manifest_data = yaml.safe_load(
-        (project_dir / "releases" / "v2.0.0" / "manifest.yaml").read_text(encoding="utf-8")
+    manifest_data = load_release_manifest_data(
+        project_dir / "releases" / "v2.0.0" / "manifest.yaml"
     )
     assert "modules" not in manifest_data
 
@@ -691,7 +723,9 @@ def test_release_create_from_release_candidate_preserves_empty_module_snapshot(
     assert "Module Stable Two" not in notes
 
 
-def test_release_create_edit_existing_release_preserves_module_snapshot(tmp_path: Path) -> None:
+def test_release_create_edit_existing_release_preserves_module_snapshot(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
     create_released_entry(mod_root, "Module Stable One", "v1.0.0", "feature")
@@ -705,7 +739,6 @@ def test_release_create_edit_existing_release_preserves_module_snapshot(tmp_path
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent One")
 
-    runner = CliRunner()
     first_release = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"],
@@ -755,6 +788,7 @@ def test_release_create_edit_existing_release_preserves_module_snapshot(tmp_path
 
 def test_release_create_edit_existing_release_preserves_empty_module_snapshot(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -769,7 +803,6 @@ def test_release_create_edit_existing_release_preserves_empty_module_snapshot(
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent One")
 
-    runner = CliRunner()
     first_release = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"],
@@ -777,7 +810,7 @@ def test_release_create_edit_existing_release_preserves_empty_module_snapshot(
     assert first_release.exit_code == 0, first_release.output
 
     manifest_path = project_dir / "releases" / "v1.0.0" / "manifest.yaml"
-    manifest_data = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(manifest_path)
     manifest_data["modules"] = {}
     manifest_path.write_text(yaml.safe_dump(manifest_data, sort_keys=False), encoding="utf-8")
 
@@ -798,7 +831,7 @@ def test_release_create_edit_existing_release_preserves_empty_module_snapshot(
     )
     assert edit_release.exit_code == 0, edit_release.output
 
-    updated_manifest = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+    updated_manifest = load_release_manifest_data(manifest_path)
     assert "modules" not in updated_manifest
 
     notes = (project_dir / "releases" / "v1.0.0" / "notes.md").read_text(encoding="utf-8")
@@ -808,7 +841,9 @@ def test_release_create_edit_existing_release_preserves_empty_module_snapshot(
     assert "Module Stable Two" not in notes
 
 
-def test_release_create_ignores_module_release_candidates_for_stable_parent(tmp_path: Path) -> None:
+def test_release_create_ignores_module_release_candidates_for_stable_parent(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
     create_released_entry(mod_root, "Stable Module Feature", "v1.0.0", "feature")
@@ -823,7 +858,6 @@ def test_release_create_ignores_module_release_candidates_for_stable_parent(tmp_
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     release_result = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v2.0.0", "--yes"],
@@ -847,6 +881,7 @@ def test_release_create_ignores_module_release_candidates_for_stable_parent(tmp_
 
 def test_release_create_release_candidate_includes_module_release_candidates(
     tmp_path: Path,
+    runner: CliRunner,
 ) -> None:
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -862,15 +897,14 @@ def test_release_create_release_candidate_includes_module_release_candidates(
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     rc_result = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v2.0.0", "--rc", "--yes"],
     )
     assert rc_result.exit_code == 0, rc_result.output
 
-    rc_manifest_data = yaml.safe_load(
-        (project_dir / "releases" / "v2.0.0-rc.1" / "manifest.yaml").read_text(encoding="utf-8")
+    rc_manifest_data = load_release_manifest_data(
+        project_dir / "releases" / "v2.0.0-rc.1" / "manifest.yaml"
     )
     assert rc_manifest_data["modules"] == {"mymod": "v1.1.0-rc.1"}
 
@@ -898,8 +932,8 @@ def test_release_create_release_candidate_includes_module_release_candidates(
     )
     assert promote_result.exit_code == 0, promote_result.output
 
-    stable_manifest_data = yaml.safe_load(
-        (project_dir / "releases" / "v2.0.0" / "manifest.yaml").read_text(encoding="utf-8")
+    stable_manifest_data = load_release_manifest_data(
+        project_dir / "releases" / "v2.0.0" / "manifest.yaml"
     )
     assert stable_manifest_data["modules"] == {"mymod": "v1.1.0-rc.1"}
 
@@ -916,7 +950,7 @@ def test_release_create_release_candidate_includes_module_release_candidates(
     assert "RC Module Feature" in stable_show_result.output
 
 
-def test_show_latest_release_includes_modules(tmp_path: Path) -> None:
+def test_show_latest_release_includes_modules(tmp_path: Path, runner: CliRunner) -> None:
     """Released-scope show output includes module sections for the latest release."""
     import json
 
@@ -933,7 +967,6 @@ def test_show_latest_release_includes_modules(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     release_result = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v2.0.0", "--yes"],
@@ -962,7 +995,7 @@ def test_show_latest_release_includes_modules(tmp_path: Path) -> None:
     assert release["modules"][0]["entries"][0]["title"] == "Module Feature"
 
 
-def test_show_release_preserves_empty_module_snapshot(tmp_path: Path) -> None:
+def test_show_release_preserves_empty_module_snapshot(tmp_path: Path, runner: CliRunner) -> None:
     """Historical show output keeps empty module snapshots empty."""
     import json
 
@@ -979,7 +1012,6 @@ def test_show_release_preserves_empty_module_snapshot(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     release_result = runner.invoke(
         cli,
         ["--root", str(project_dir), "release", "create", "v2.0.0", "--yes"],
@@ -987,7 +1019,7 @@ def test_show_release_preserves_empty_module_snapshot(tmp_path: Path) -> None:
     assert release_result.exit_code == 0, release_result.output
 
     manifest_path = project_dir / "releases" / "v2.0.0" / "manifest.yaml"
-    manifest_data = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+    manifest_data = load_release_manifest_data(manifest_path)
     manifest_data["modules"] = {}
     manifest_path.write_text(yaml.safe_dump(manifest_data, sort_keys=False), encoding="utf-8")
 
@@ -1013,7 +1045,7 @@ def test_show_release_preserves_empty_module_snapshot(tmp_path: Path) -> None:
     assert "modules" not in release
 
 
-def test_show_release_json_includes_modules(tmp_path: Path) -> None:
+def test_show_release_json_includes_modules(tmp_path: Path, runner: CliRunner) -> None:
     """JSON output includes modules array with released entries."""
     import json
 
@@ -1030,7 +1062,6 @@ def test_show_release_json_includes_modules(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Parent Feature")
 
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["--root", str(project_dir), "show", "--release", "-j", "unreleased"]
     )
@@ -1049,7 +1080,7 @@ def test_show_release_json_includes_modules(tmp_path: Path) -> None:
     assert release["modules"][0]["entries"][0]["title"] == "Module Feature"
 
 
-def test_show_release_no_modules_no_separator(tmp_path: Path) -> None:
+def test_show_release_no_modules_no_separator(tmp_path: Path, runner: CliRunner) -> None:
     """When no modules exist, no separator is added."""
     project_dir = tmp_path / "changelog"
     project_dir.mkdir()
@@ -1057,7 +1088,6 @@ def test_show_release_no_modules_no_separator(tmp_path: Path) -> None:
     (project_dir / "unreleased").mkdir()
     create_entry(project_dir, "Test Feature")
 
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["--root", str(project_dir), "show", "--release", "-m", "unreleased"]
     )
@@ -1081,7 +1111,9 @@ def create_entry_with_timestamp(
     return entry_path
 
 
-def test_cli_show_multi_project_sorts_entries_oldest_first(tmp_path: Path) -> None:
+def test_cli_show_multi_project_sorts_entries_oldest_first(
+    tmp_path: Path, runner: CliRunner
+) -> None:
     """Multi-project show command sorts entries oldest-first within each project."""
     packages = tmp_path / "packages"
     mod_root = create_module(packages, "mymod", "My Module")
@@ -1104,7 +1136,6 @@ def test_cli_show_multi_project_sorts_entries_oldest_first(tmp_path: Path) -> No
     create_entry_with_timestamp(project_dir, "Oldest Parent Entry", "2025-01-01T00:00:00Z")
     create_entry_with_timestamp(project_dir, "Middle Parent Entry", "2025-01-02T00:00:00Z")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--root", str(project_dir), "show"])
 
     assert result.exit_code == 0
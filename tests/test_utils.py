@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from tenzir_ship.utils import extract_excerpt
+from datetime import date
+
+import yaml
+
+from tenzir_ship.utils import extract_excerpt, load_yaml, slugify
 
 
 def test_extract_excerpt_collapses_first_paragraph() -> None:
@@ -15,3 +19,16 @@ Additional details in the second paragraph."""
 
 def test_extract_excerpt_handles_whitespace_only() -> None:
     assert extract_excerpt("   \n  ") == ""
+
+
+def test_load_yaml_matches_safe_load() -> None:
+    text = "created: 2024-01-02\nprs:\n  - 42\nflag: yes\ntitle: 'x: y'\n"
+    assert load_yaml(text) == yaml.safe_load(text)
+    assert load_yaml(text.encode("utf-8"))["created"] == date(2024, 1, 2)
+
+
+def test_slugify_collapses_separators_and_drops_punctuation() -> None:
+    assert slugify("Exciting Feature") == "exciting-feature"
+    assert slugify("  Fix: ingest -- crash_now!  ") == "fix-ingest-crash-now"
+    assert slugify("Überprüfung 2.0") == "überprüfung-20"
+    assert slugify("!!!") == "project"